@@ -200,21 +200,23 @@ async def get_scheduler_status(
     try:
         from app.utils.celery_helpers import (
             get_celery_status,
-            get_celery_runtime_heartbeat,
-            get_last_fetch_time,
+            get_scheduler_runtime_snapshot,
         )
         from main import redis_client
 
         # Get Celery status
-        celery_status = await get_celery_status()
+        celery_status = await get_celery_status(redis_client)
 
         # Get last fetch time from Redis (reuse global client)
         last_fetch = None
+        last_fetch_saved = None
         runtime_heartbeat = {"status": "unavailable"}
         if redis_client:
             try:
-                last_fetch = await get_last_fetch_time(redis_client)
-                runtime_heartbeat = await get_celery_runtime_heartbeat(redis_client)
+                snapshot = await get_scheduler_runtime_snapshot(redis_client)
+                last_fetch = snapshot["last_fetch"]
+                last_fetch_saved = snapshot["last_fetch_saved"]
+                runtime_heartbeat = snapshot["heartbeat"]
             except Exception as e:
                 logger.error(f"Error getting scheduler runtime details: {e}")
 
@@ -222,6 +224,7 @@ async def get_scheduler_status(
             "celery": celery_status,
             "runtime_heartbeat": runtime_heartbeat,
             "last_fetch": last_fetch.isoformat() if last_fetch else None,
+            "last_fetch_saved": last_fetch_saved,
             "scheduler_type": "Celery Beat",
             "message": "News fetching runs automatically via Celery worker"
         }
@@ -545,5 +545,5 @@ async def get_integration_stats(
             "queued": j.queued,
             "failed_or_dead_letter": j.failed,
         },
-        "limits": settings.integration_limits,
+        "limits": dict(settings.integration_limits),
     }
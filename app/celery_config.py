@@ -1,8 +1,15 @@
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, TypeVar
+from datetime import datetime, timezone
+import asyncio
+import threading
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown, worker_ready, worker_shutdown
 from kombu import Queue
 import logging
 
+from app.core.redis_keys import redis_key
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -180,6 +187,143 @@ if settings.ENABLE_INTEGRATION_API and settings.ENABLE_INTEGRATION_DELIVERY:
         }
     )
 
+T = TypeVar("T")
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_thread: Optional[threading.Thread] = None
+_worker_loop_guard = threading.Lock()
+_worker_loop_cleanups: List[Callable[[], Awaitable[None]]] = []
+
+
+def _start_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop, _worker_loop_thread
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="celery-async-loop", daemon=True)
+    thread.start()
+    _worker_loop, _worker_loop_thread = loop, thread
+    return loop
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop used by tasks, starting it on first use."""
+    loop = _worker_loop
+    if loop is not None and not loop.is_closed():
+        return loop
+    with _worker_loop_guard:
+        if _worker_loop is None or _worker_loop.is_closed():
+            return _start_worker_loop()
+        return _worker_loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the worker loop and block until it finishes.
+
+    Reusing one loop per worker process keeps pooled DB and Redis connections
+    alive between tasks instead of rebuilding them under a fresh ``asyncio.run``.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_worker_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. SoftTimeLimitExceeded raised in the task thread: stop the coroutine too.
+        future.cancel()
+        raise
+
+
+def register_worker_loop_cleanup(cleanup: Callable[[], Awaitable[None]]) -> None:
+    """Register a coroutine function to run on the worker loop before it stops."""
+    _worker_loop_cleanups.append(cleanup)
+
+
+@worker_process_init.connect
+def _init_worker_loop(**_kwargs):
+    global _worker_loop, _worker_loop_thread
+    # Loop threads do not survive fork; drop any state inherited from the parent.
+    with _worker_loop_guard:
+        _worker_loop, _worker_loop_thread = None, None
+        _start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _stop_worker_loop(**_kwargs):
+    global _worker_loop, _worker_loop_thread
+    with _worker_loop_guard:
+        loop, thread = _worker_loop, _worker_loop_thread
+        _worker_loop, _worker_loop_thread = None, None
+    if loop is None or loop.is_closed():
+        return
+
+    for cleanup in _worker_loop_cleanups:
+        try:
+            asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Worker loop cleanup failed: {e}")
+
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=5)
+    if not loop.is_running():
+        loop.close()
+
+
+# Workers push their task counts to Redis so status checks need no inspect() broadcast.
+WORKER_STATE_INTERVAL_SECONDS = 2
+WORKER_STATE_TTL_SECONDS = 10
+
+_worker_state_stop = threading.Event()
+
+
+def _publish_worker_state(hostname: str) -> None:
+    import redis
+    from celery.worker import state as worker_state
+
+    client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    key = redis_key("celery", "workers", hostname)
+    try:
+        while not _worker_state_stop.is_set():
+            active = len(worker_state.active_requests)
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.hset(
+                    key,
+                    mapping={
+                        "active": active,
+                        # Reserved but not yet executing: prefetched and ETA/countdown tasks.
+                        "scheduled": max(0, len(worker_state.reserved_requests) - active),
+                        "ts": datetime.now(timezone.utc).isoformat(),
+                    },
+                )
+                pipe.expire(key, WORKER_STATE_TTL_SECONDS)
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"Failed to publish worker state: {e}")
+            _worker_state_stop.wait(WORKER_STATE_INTERVAL_SECONDS)
+        client.delete(key)
+    except Exception as e:
+        logger.debug(f"Worker state publisher stopped: {e}")
+    finally:
+        client.close()
+
+
+@worker_ready.connect
+def _start_worker_state_publisher(sender=None, **_kwargs):
+    hostname = getattr(sender, "hostname", None)
+    if not hostname:
+        return
+    _worker_state_stop.clear()
+    threading.Thread(
+        target=_publish_worker_state,
+        args=(hostname,),
+        name="celery-worker-state",
+        daemon=True,
+    ).start()
+
+
+@worker_shutdown.connect
+def _stop_worker_state_publisher(**_kwargs):
+    _worker_state_stop.set()
+
+
 # Ensure task modules are registered for worker/inspect tooling.
 celery_app.autodiscover_tasks(["app"], related_name="tasks", force=True)
 
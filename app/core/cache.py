@@ -199,24 +199,25 @@ class CacheManager:
                 return 0
 
             ttl = ttl or self.default_ttl
-            pipe = self.redis.pipeline()
+            # Plain pipeline: the writes are independent, so MULTI/EXEC buys nothing.
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    full_key = self._make_key(key)
+                    if serializer is json.dumps:
+                        serialized = json.dumps(value, default=self._json_default)
+                    else:
+                        serialized = serializer(value)
+                    if isinstance(serialized, str):
+                        serialized = serialized.encode('utf-8')
 
-            for key, value in items.items():
-                full_key = self._make_key(key)
-                if serializer is json.dumps:
-                    serialized = json.dumps(value, default=self._json_default)
-                else:
-                    serialized = serializer(value)
-                if isinstance(serialized, str):
-                    serialized = serialized.encode('utf-8')
+                    # Compress large values
+                    if len(serialized) > self.compression_threshold:
+                        serialized = gzip.compress(serialized, compresslevel=6)
 
-                # Compress large values
-                if len(serialized) > self.compression_threshold:
-                    serialized = gzip.compress(serialized, compresslevel=6)
+                    pipe.setex(full_key, ttl, serialized)
 
-                pipe.setex(full_key, ttl, serialized)
+                await pipe.execute()
 
-            await pipe.execute()
             logger.debug(f"Batch set: {len(items)} items")
             return len(items)
 
@@ -13,11 +13,15 @@ class JWTManager:
 
     def __init__(self):
         self.algorithm = settings.JWT_ALGORITHM
-        self.private_key = settings.JWT_PRIVATE_KEY
-        self.public_key = settings.JWT_PUBLIC_KEY
+        self.private_key = settings.jwt_private_key
+        self.public_key = settings.jwt_public_key
         self.access_token_expire = settings.ACCESS_TOKEN_EXPIRE_HOURS
         self.refresh_token_expire = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
+        # Parsed key objects when available; jose re-parses raw PEM text on every call
+        self.signing_key = settings.jwt_private_key_obj or self.private_key
+        self.verification_key = settings.jwt_public_key_obj or self.public_key
+
         if not self.private_key or not self.public_key:
             logger.warning("JWT keys not configured. Tokens will not work properly.")
 
@@ -43,7 +47,7 @@ class JWTManager:
         try:
             token = jwt.encode(
                 claims,
-                self.private_key,
+                self.signing_key,
                 algorithm=self.algorithm
             )
             return token
@@ -76,7 +80,7 @@ class JWTManager:
         try:
             token = jwt.encode(
                 claims,
-                self.private_key,
+                self.signing_key,
                 algorithm=self.algorithm
             )
             return token
@@ -91,7 +95,7 @@ class JWTManager:
         try:
             payload = jwt.decode(
                 token,
-                self.public_key,
+                self.verification_key,
                 algorithms=[self.algorithm]
             )
             return payload
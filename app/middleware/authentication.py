@@ -32,8 +32,9 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     def __init__(self, app):
         super().__init__(app)
         if settings.JWT_ALGORITHM == "RS256":
-            self.secret_key = settings.JWT_PUBLIC_KEY  # Public key for verification
-            self.signing_key = settings.JWT_PRIVATE_KEY  # Private key for signing
+            # Parsed key objects when available; jose re-parses raw PEM text on every call
+            self.secret_key = settings.jwt_public_key_obj or settings.jwt_public_key  # Public key for verification
+            self.signing_key = settings.jwt_private_key_obj or settings.jwt_private_key  # Private key for signing
         else:
             # For HS256, use SECRET_KEY
             self.secret_key = settings.SECRET_KEY
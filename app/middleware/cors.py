@@ -29,7 +29,16 @@ class CORSMiddleware(BaseHTTPMiddleware):
         self.enabled = settings.CORS_ENABLED
 
         # Compile allowed origins for faster lookup
-        self.allowed_origins_set = set(self.allow_origins) if "*" not in self.allow_origins else None
+        self.allowed_origins_set = frozenset(self.allow_origins) if allow_origins else settings.cors_origins_set
+        self.allow_all_origins = "*" in self.allowed_origins_set
+        self.allowed_methods_set = frozenset(self.allow_methods) if allow_methods else settings.cors_allow_methods_set
+        self.allow_all_methods = "*" in self.allowed_methods_set
+        self.allow_all_headers = "*" in self.allow_headers
+
+        # Preflight header values only depend on configuration
+        self.allow_methods_header = ", ".join(self.allow_methods)
+        self.allow_headers_header = ", ".join(self.allow_headers)
+        self.max_age_header = str(self.max_age)
 
     async def dispatch(self, request: Request, call_next) -> Response:
         """Handle CORS for incoming requests"""
@@ -62,14 +71,11 @@ class CORSMiddleware(BaseHTTPMiddleware):
             return False
 
         # Allow all origins if "*" is in whitelist
-        if "*" in self.allow_origins:
+        if self.allow_all_origins:
             return True
 
         # Check against whitelist
-        if self.allowed_origins_set:
-            return origin in self.allowed_origins_set
-
-        return False
+        return origin in self.allowed_origins_set
 
     def _handle_preflight(
         self,
@@ -91,7 +97,7 @@ class CORSMiddleware(BaseHTTPMiddleware):
         requested_headers = request.headers.get("access-control-request-headers")
 
         # Validate requested method ("*" allows all methods)
-        if requested_method and "*" not in self.allow_methods and requested_method not in self.allow_methods:
+        if requested_method and not self.allow_all_methods and requested_method not in self.allowed_methods_set:
             logger.warning(f"CORS method not allowed: {requested_method}")
             return Response(
                 content="Method not allowed",
@@ -101,19 +107,19 @@ class CORSMiddleware(BaseHTTPMiddleware):
         # Create preflight response
         headers = {
             "Access-Control-Allow-Origin": origin,
-            "Access-Control-Allow-Methods": ", ".join(self.allow_methods),
-            "Access-Control-Max-Age": str(self.max_age),
+            "Access-Control-Allow-Methods": self.allow_methods_header,
+            "Access-Control-Max-Age": self.max_age_header,
             "Vary": "Origin"
         }
 
         # Add allowed headers
-        if "*" in self.allow_headers:
+        if self.allow_all_headers:
             if requested_headers:
                 headers["Access-Control-Allow-Headers"] = requested_headers
             else:
                 headers["Access-Control-Allow-Headers"] = "*"
         else:
-            headers["Access-Control-Allow-Headers"] = ", ".join(self.allow_headers)
+            headers["Access-Control-Allow-Headers"] = self.allow_headers_header
 
         # Add credentials header
         if self.allow_credentials:
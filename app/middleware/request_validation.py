@@ -47,6 +47,7 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.max_size = settings.max_request_size_bytes
         self.allowed_types = settings.ALLOWED_CONTENT_TYPES
+        self.allowed_types_set = settings.allowed_content_types_set
         self.log_requests = settings.LOG_REQUESTS
 
     async def dispatch(self, request: Request, call_next) -> Response:
@@ -115,8 +116,8 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         if not content_type:
             return  # Allow empty content type for GET requests
 
-        # Check if content type is allowed
-        allowed = any(
+        # Check if content type is allowed (exact match first, then prefix match)
+        allowed = content_type in self.allowed_types_set or any(
             content_type.startswith(allowed_type)
             for allowed_type in self.allowed_types
         )
@@ -9,15 +9,18 @@ logger = logging.getLogger(__name__)
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Add security headers to response"""
-
-        response: Response = await call_next(request)
-
-        # Remove server header (don't expose server info)
-        if "Server" in response.headers:
-            del response.headers["Server"]
-
+    def __init__(self, app):
+        super().__init__(app)
+        # Headers depend only on settings, so encode them once instead of per response
+        self._raw_headers = [
+            (name.lower().encode("latin-1"), value if isinstance(value, bytes) else value.encode("latin-1"))
+            for name, value in self._build_security_headers().items()
+        ]
+        # Server header is stripped (don't expose server info); the rest are replaced
+        self._replaced_names = frozenset(name for name, _ in self._raw_headers) | {b"server"}
+
+    @staticmethod
+    def _build_security_headers() -> dict:
         # Basic security headers (always applied)
         security_headers = {
             # Prevent MIME type sniffing
@@ -52,26 +55,31 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
         # HSTS (HTTP Strict Transport Security) - Production only
         if settings.ENABLE_HSTS and settings.is_production:
-            security_headers["Strict-Transport-Security"] = (
-                f"max-age={settings.HSTS_MAX_AGE}; "
-                "includeSubDomains; preload"
-            )
+            security_headers["Strict-Transport-Security"] = settings.hsts_header_bytes
 
         # Content Security Policy
         if settings.ENABLE_CSP:
-            security_headers["Content-Security-Policy"] = settings.CSP_POLICY
+            security_headers["Content-Security-Policy"] = settings.csp_policy_bytes
 
         # API-specific headers (version only exposed in non-production)
         if not settings.is_production:
             security_headers["X-API-Version"] = settings.APP_VERSION
 
-        # Apply all headers
-        for header, value in security_headers.items():
-            response.headers[header] = value
+        return security_headers
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        """Add security headers to response"""
+
+        response: Response = await call_next(request)
+
+        # Apply all headers, replacing any the endpoint already set
+        raw_headers = response.raw_headers
+        replaced = self._replaced_names
+        raw_headers[:] = [header for header in raw_headers if header[0] not in replaced]
+        raw_headers.extend(self._raw_headers)
 
         # Log security header application (debug only)
         if settings.DEBUG:
-            logger.debug(f"Applied {len(security_headers)} security headers to {request.url.path}")
+            logger.debug(f"Applied {len(self._raw_headers)} security headers to {request.url.path}")
 
         return response
-
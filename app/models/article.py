@@ -2,6 +2,8 @@ from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, F
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+from functools import cached_property
+from typing import Optional
 import uuid
 from app.core.database import Base
 
@@ -84,6 +86,16 @@ class Article(Base):
         lazy='dynamic'  # Returns query object - good for potentially large feedback collections
     )
 
+    @cached_property
+    def article_id_str(self) -> str:
+        """String form of ``article_id``, computed once per loaded instance."""
+        return str(self.article_id)
+
+    @cached_property
+    def published_date_iso(self) -> Optional[str]:
+        """ISO-8601 ``published_date``, computed once per loaded instance."""
+        return self.published_date.isoformat() if self.published_date else None
+
     def __repr__(self):
         return f"<Article(id={self.article_id}, title={self.title[:50]})>"
 
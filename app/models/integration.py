@@ -223,7 +223,12 @@ class WebhookDeliveryJob(Base):
     )
 
     webhook = relationship("UserWebhook", back_populates="delivery_jobs")
-    items = relationship("WebhookDeliveryItem", back_populates="job", cascade="all, delete-orphan")
+    items = relationship(
+        "WebhookDeliveryItem",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="WebhookDeliveryItem.position",
+    )
 
 
 class WebhookDeliveryItem(Base):
@@ -2,87 +2,149 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 import hashlib
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 import logging
 
+from app.core.redis_keys import redis_key
 from app.models.integration import UserWebhook, WebhookDeliveryItem, WebhookDeliveryJob
 from app.services.feed_service import feed_service
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+TERMINAL_JOB_STATUSES = ("delivered", "cancelled", "dead_letter")
+# Earliest time any active webhook becomes due; the planner skips its tick while this lies in the future.
+PLANNER_NEXT_DUE_KEY = redis_key("integration", "webhook", "next_due_at")
+
 
 class DeliveryPlannerService:
     @staticmethod
-    async def get_due_webhooks(*, db: AsyncSession, now: Optional[datetime] = None) -> List[UserWebhook]:
-        now = now or datetime.now(timezone.utc)
+    async def get_active_webhooks(*, db: AsyncSession) -> List[UserWebhook]:
         result = await db.execute(
             select(UserWebhook).where(
                 UserWebhook.is_active.is_(True),
                 UserWebhook.failure_count < UserWebhook.max_failures,
             )
         )
-        webhooks = list(result.scalars().all())
+        return list(result.scalars().all())
 
-        due: List[UserWebhook] = []
+    @staticmethod
+    def webhook_due_at(webhook: UserWebhook, *, min_interval: int) -> Optional[datetime]:
+        """Return when ``webhook`` next becomes due, or None if it has no anchor and is due now."""
+        interval = max(webhook.batch_interval_minutes or min_interval, min_interval)
+        anchor = webhook.last_attempted_at or webhook.created_at
+        return anchor + timedelta(minutes=interval) if anchor else None
+
+    @classmethod
+    def filter_due_webhooks(cls, webhooks: List[UserWebhook], *, now: datetime) -> List[UserWebhook]:
         min_interval = settings.integration_limits["min_batch_interval_minutes"]
+        due: List[UserWebhook] = []
         for webhook in webhooks:
-            interval = max(webhook.batch_interval_minutes or min_interval, min_interval)
-            anchor = webhook.last_attempted_at or webhook.created_at
-            if not anchor or (now - anchor) >= timedelta(minutes=interval):
+            due_at = cls.webhook_due_at(webhook, min_interval=min_interval)
+            if due_at is None or due_at <= now:
                 due.append(webhook)
         return due
 
+    @classmethod
+    def next_due_at(cls, webhooks: List[UserWebhook], *, now: datetime) -> Optional[datetime]:
+        """Earliest due time across ``webhooks``; ``now`` if any is already due, None if the list is empty."""
+        min_interval = settings.integration_limits["min_batch_interval_minutes"]
+        next_due: Optional[datetime] = None
+        for webhook in webhooks:
+            due_at = cls.webhook_due_at(webhook, min_interval=min_interval)
+            if due_at is None or due_at <= now:
+                return now
+            if next_due is None or due_at < next_due:
+                next_due = due_at
+        return next_due
+
+    @classmethod
+    async def get_due_webhooks(cls, *, db: AsyncSession, now: Optional[datetime] = None) -> List[UserWebhook]:
+        now = now or datetime.now(timezone.utc)
+        webhooks = await cls.get_active_webhooks(db=db)
+        return cls.filter_due_webhooks(webhooks, now=now)
+
+    @staticmethod
+    async def load_webhook_sources(
+        *,
+        webhooks: List[UserWebhook],
+        db: AsyncSession,
+    ) -> Dict[Tuple[str, UUID], Any]:
+        """Load the feeds and bundles targeted by ``webhooks`` in one query per kind."""
+        feed_ids = [webhook.feed_id for webhook in webhooks if webhook.feed_id]
+        bundle_ids = [webhook.bundle_id for webhook in webhooks if not webhook.feed_id and webhook.bundle_id]
+        feeds = await feed_service.get_feeds_by_ids(feed_ids=feed_ids, db=db)
+        bundles = await feed_service.get_bundles_by_ids(bundle_ids=bundle_ids, db=db)
+
+        sources: Dict[Tuple[str, UUID], Any] = {("feed", feed_id): feed for feed_id, feed in feeds.items()}
+        sources.update({("bundle", bundle_id): bundle for bundle_id, bundle in bundles.items()})
+        return sources
+
     @staticmethod
     async def compute_webhook_batch_items(
         *,
         webhook: UserWebhook,
         db: AsyncSession,
+        sources: Optional[Dict[Tuple[str, UUID], Any]] = None,
+        entries_cache: Optional[Dict[Tuple, List[Dict]]] = None,
     ) -> Tuple[List[Dict], datetime, datetime]:
         now = datetime.now(timezone.utc)
         window_start = webhook.last_success_cursor_published_at or (now - timedelta(minutes=webhook.batch_interval_minutes))
         window_end = now
         limit = settings.integration_limits["max_items_per_batch"]
 
-        if webhook.feed_id:
-            feed = await feed_service.get_feed(feed_id=webhook.feed_id, user_id=webhook.user_id, db=db)
-            if not feed:
-                return [], window_start, window_end
-            entries = await feed_service.get_feed_articles(
-                feed=feed,
-                user_id=webhook.user_id,
-                db=db,
-                limit=limit,
-                since=window_start,
-                sort="date",
-            )
+        source_key = ("feed", webhook.feed_id) if webhook.feed_id else ("bundle", webhook.bundle_id)
+        if sources is not None:
+            source = sources.get(source_key)
+            if source is not None and source.user_id != webhook.user_id:
+                source = None
+        elif webhook.feed_id:
+            source = await feed_service.get_feed(feed_id=webhook.feed_id, user_id=webhook.user_id, db=db)
         else:
-            bundle = await feed_service.get_bundle(bundle_id=webhook.bundle_id, user_id=webhook.user_id, db=db)
-            if not bundle:
-                return [], window_start, window_end
-            entries = await feed_service.get_bundle_articles(
-                bundle=bundle,
-                user_id=webhook.user_id,
-                db=db,
-                limit=limit,
-                since=window_start,
-                sort="date",
-            )
+            source = await feed_service.get_bundle(bundle_id=webhook.bundle_id, user_id=webhook.user_id, db=db)
+        if not source:
+            return [], window_start, window_end
+
+        # Webhooks sharing a source, owner and window resolve to the same candidates.
+        cache_key = (*source_key, webhook.user_id, window_start)
+        entries = entries_cache.get(cache_key) if entries_cache is not None else None
+        if entries is None:
+            if webhook.feed_id:
+                entries = await feed_service.get_feed_articles(
+                    feed=source,
+                    user_id=webhook.user_id,
+                    db=db,
+                    limit=limit,
+                    since=window_start,
+                    sort="date",
+                )
+            else:
+                entries = await feed_service.get_bundle_articles(
+                    bundle=source,
+                    user_id=webhook.user_id,
+                    db=db,
+                    limit=limit,
+                    since=window_start,
+                    sort="date",
+                )
+            if entries_cache is not None:
+                entries_cache[cache_key] = entries
 
         payload_items: List[Dict] = []
         for entry in entries:
             article = entry["article"]
             payload_items.append(
                 {
-                    "article_id": str(article.article_id),
+                    "article_id": article.article_id_str,
                     "title": article.title,
                     "url": article.url,
                     "source_name": article.source_name,
-                    "published_date": article.published_date.isoformat() if article.published_date else None,
+                    "published_date": article.published_date_iso,
                     "topics": article.topics or [],
                     "relevance_score": entry.get("score"),
                 }
@@ -141,6 +203,109 @@ class DeliveryPlannerService:
         logger.info("Created webhook delivery job %s with %s items", job.job_id, len(items))
         return job
 
+    @staticmethod
+    async def claim_job(*, job_id: UUID, db: AsyncSession, lease: timedelta) -> bool:
+        """Move a deliverable job to ``processing`` with one conditional UPDATE.
+
+        Returns ``False`` when the job is missing, terminal, or held by another
+        worker whose lease has not expired. The claim is left uncommitted so the
+        caller can fold it into its next commit.
+        """
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            update(WebhookDeliveryJob)
+            .where(
+                WebhookDeliveryJob.job_id == job_id,
+                WebhookDeliveryJob.status.notin_(TERMINAL_JOB_STATUSES),
+                or_(
+                    WebhookDeliveryJob.status != "processing",
+                    WebhookDeliveryJob.updated_at < now - lease,
+                ),
+                # A failed job waits out its backoff instead of being re-sent by a queued sibling task
+                or_(
+                    WebhookDeliveryJob.status != "retry_pending",
+                    WebhookDeliveryJob.next_retry_at.is_(None),
+                    WebhookDeliveryJob.next_retry_at <= now,
+                ),
+            )
+            .values(status="processing", updated_at=now)
+            .returning(WebhookDeliveryJob.job_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    async def claim_pending_sibling_jobs(
+        *,
+        job: WebhookDeliveryJob,
+        db: AsyncSession,
+        limit: int,
+        item_budget: int,
+    ) -> List[WebhookDeliveryJob]:
+        """Atomically move other pending jobs of the same webhook to ``processing`` and load their items.
+
+        Jobs are taken oldest first until ``limit`` jobs or ``item_budget`` articles
+        would be exceeded; the rest stay pending for their own delivery tasks.
+        """
+        if limit <= 0 or item_budget <= 0:
+            await db.commit()
+            return []
+
+        # Postgres rejects FOR UPDATE alongside window functions, so the running item total is applied below
+        candidates = await db.execute(
+            select(WebhookDeliveryJob.job_id, WebhookDeliveryJob.article_count)
+            .where(
+                WebhookDeliveryJob.webhook_id == job.webhook_id,
+                WebhookDeliveryJob.job_id != job.job_id,
+                WebhookDeliveryJob.status == "pending",
+            )
+            .order_by(WebhookDeliveryJob.window_end.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        selected_ids = []
+        for candidate_id, article_count in candidates.all():
+            if article_count > item_budget:
+                break
+            item_budget -= article_count
+            selected_ids.append(candidate_id)
+
+        claimed_ids = []
+        if selected_ids:
+            claim_result = await db.execute(
+                update(WebhookDeliveryJob)
+                .where(WebhookDeliveryJob.job_id.in_(selected_ids), WebhookDeliveryJob.status == "pending")
+                .values(status="processing", updated_at=datetime.now(timezone.utc))
+                .returning(WebhookDeliveryJob.job_id)
+                .execution_options(synchronize_session=False)
+            )
+            claimed_ids = [row[0] for row in claim_result.fetchall()]
+        await db.commit()
+        if not claimed_ids:
+            return []
+
+        result = await db.execute(
+            select(WebhookDeliveryJob)
+            .options(selectinload(WebhookDeliveryJob.items).selectinload(WebhookDeliveryItem.article))
+            .where(WebhookDeliveryJob.job_id.in_(claimed_ids))
+            .order_by(WebhookDeliveryJob.window_end.asc())
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def release_claimed_jobs(*, job_ids: List[UUID], db: AsyncSession) -> None:
+        """Return claimed jobs to ``pending`` after an aborted delivery attempt."""
+        if not job_ids:
+            return
+        await db.execute(
+            update(WebhookDeliveryJob)
+            .where(WebhookDeliveryJob.job_id.in_(job_ids), WebhookDeliveryJob.status == "processing")
+            .values(status="pending", updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
     @staticmethod
     async def mark_job_success(
         *,
@@ -148,10 +313,15 @@ class DeliveryPlannerService:
         webhook: UserWebhook,
         latest_item: Optional[Dict],
         db: AsyncSession,
+        coalesced_jobs: Optional[List[WebhookDeliveryJob]] = None,
     ) -> None:
         now = datetime.now(timezone.utc)
-        job.status = "delivered"
-        job.updated_at = now
+        await db.execute(
+            update(WebhookDeliveryJob)
+            .where(WebhookDeliveryJob.job_id.in_([job.job_id, *(j.job_id for j in coalesced_jobs or [])]))
+            .values(status="delivered", updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
         webhook.last_triggered_at = now
         webhook.failure_count = 0
         if latest_item:
@@ -168,20 +338,25 @@ class DeliveryPlannerService:
         webhook: UserWebhook,
         error: str,
         db: AsyncSession,
+        coalesced_jobs: Optional[List[WebhookDeliveryJob]] = None,
     ) -> None:
         now = datetime.now(timezone.utc)
-        job.attempts = int(job.attempts or 0) + 1
         webhook.failure_count = int(webhook.failure_count or 0) + 1
-        job.last_error = error[:2000]
-        job.updated_at = now
+        for failed_job in [job, *(coalesced_jobs or [])]:
+            failed_job.attempts = int(failed_job.attempts or 0) + 1
+            failed_job.last_error = error[:2000]
+            failed_job.updated_at = now
 
-        if job.attempts >= settings.INTEGRATION_WEBHOOK_MAX_FAILURES or webhook.failure_count >= webhook.max_failures:
-            job.status = "dead_letter"
-            webhook.is_active = False
-        else:
-            backoff_minutes = [1, 5, 15, 60, 240][min(job.attempts - 1, 4)]
-            job.next_retry_at = now + timedelta(minutes=backoff_minutes)
-            job.status = "retry_pending"
+            if (
+                failed_job.attempts >= settings.INTEGRATION_WEBHOOK_MAX_FAILURES
+                or webhook.failure_count >= webhook.max_failures
+            ):
+                failed_job.status = "dead_letter"
+                webhook.is_active = False
+            else:
+                backoff_minutes = [1, 5, 15, 60, 240][min(failed_job.attempts - 1, 4)]
+                failed_job.next_retry_at = now + timedelta(minutes=backoff_minutes)
+                failed_job.status = "retry_pending"
 
         await db.commit()
 
@@ -29,6 +29,7 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.SMTP_FROM_EMAIL or settings.SMTP_USER
         self.from_name = settings.SMTP_FROM_NAME
+        self.from_header = settings.smtp_from_header
 
         self.graph_tenant_id = settings.GRAPH_TENANT_ID
         self.graph_client_id = settings.GRAPH_CLIENT_ID
@@ -509,7 +510,7 @@ class EmailService:
         try:
             msg = MIMEMultipart("alternative")
             msg["Subject"] = subject
-            msg["From"] = f"{self.from_name} <{self.from_email}>"
+            msg["From"] = self.from_header
             msg["To"] = to_email
 
             if text_content:
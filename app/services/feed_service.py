@@ -179,6 +179,13 @@ class FeedService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_feeds_by_ids(*, feed_ids: List[UUID], db: AsyncSession) -> Dict[UUID, UserCustomFeed]:
+        if not feed_ids:
+            return {}
+        result = await db.execute(select(UserCustomFeed).where(UserCustomFeed.feed_id.in_(set(feed_ids))))
+        return {feed.feed_id: feed for feed in result.scalars().all()}
+
     @staticmethod
     async def get_feed_by_slug(*, slug: str, db: AsyncSession) -> Optional[UserCustomFeed]:
         result = await db.execute(
@@ -314,6 +321,13 @@ class FeedService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_bundles_by_ids(*, bundle_ids: List[UUID], db: AsyncSession) -> Dict[UUID, UserFeedBundle]:
+        if not bundle_ids:
+            return {}
+        result = await db.execute(select(UserFeedBundle).where(UserFeedBundle.bundle_id.in_(set(bundle_ids))))
+        return {bundle.bundle_id: bundle for bundle in result.scalars().all()}
+
     @staticmethod
     async def get_bundle_by_slug(*, slug: str, db: AsyncSession) -> Optional[UserFeedBundle]:
         result = await db.execute(
@@ -18,7 +18,7 @@ import logging
 
 from app.core.redis_keys import redis_key
 from app.schemas.raw_article import RawArticle
-from app.utils.date_parser import parse_iso_date, parse_gdelt_date, parse_rss_date
+from app.utils.date_parser import parse_iso_dates_batch, parse_gdelt_date, parse_rss_date
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -237,8 +237,11 @@ class NewsAPIFetcher(BaseFetcher):
             if category:
                 topic_hints = _normalize_topic_values(topic_hints + [category])
 
+            raw_items = data.get('articles', [])
+            published_dates = parse_iso_dates_batch([item.get('publishedAt') for item in raw_items])
+
             articles = []
-            for item in data.get('articles', []):
+            for item, published_date in zip(raw_items, published_dates):
                 article = self._to_article({
                     'title': item.get('title', ''),
                     'content': item.get('content') or item.get('description', ''),
@@ -246,7 +249,7 @@ class NewsAPIFetcher(BaseFetcher):
                     'url': item.get('url', ''),
                     'source': item.get('source', {}).get('name', 'NewsAPI'),
                     'author': item.get('author'),
-                    'published_date': parse_iso_date(item.get('publishedAt')),
+                    'published_date': published_date,
                     'image_url': item.get('urlToImage'),
                     'language': language,
                     'topics': topic_hints,
@@ -52,7 +52,7 @@ class NewsIngestionService:
         return deduped_sources
 
     @staticmethod
-    def resolve_feed_urls(source_list: Sequence[str], topics: Optional[Sequence[str]]) -> Optional[List[str]]:
+    def resolve_feed_urls(source_list: Sequence[str], topics: Optional[Sequence[str]]) -> Optional[Sequence[str]]:
         if "rss" not in source_list or not settings.ENABLE_RSS_FEEDS:
             return None
         return settings.get_rss_feed_urls_for_topics(list(topics or []))
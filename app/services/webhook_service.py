@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from html import escape
 import hmac
 import hashlib
 import ipaddress
-import json
 import re
 import secrets
 import socket
@@ -15,11 +15,13 @@ from uuid import UUID
 
 from cryptography.fernet import Fernet, InvalidToken
 import httpx
+import orjson
 from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from app.models.integration import UserFeedBundle, UserCustomFeed, UserWebhook, WebhookDeliveryJob
+from app.services.delivery_planner_service import PLANNER_NEXT_DUE_KEY
 from app.services.email_service import email_service
 from app.services.feed_service import feed_service
 from config import settings
@@ -32,13 +34,15 @@ class WebhookService:
     TELEGRAM_CHAT_ID_PATTERN = re.compile(r"^(-?\d{1,20}|@[A-Za-z0-9_]{5,64})$")
 
     @staticmethod
-    def _build_fernet_keys() -> List[Fernet]:
+    @lru_cache(maxsize=1)
+    def _build_fernet_keys() -> Tuple[Fernet, ...]:
+        # Settings are frozen, so the key objects are built once per process
         keys: List[Fernet] = []
-        current_key = settings.get_integration_encryption_key()
+        current_key = settings.integration_encryption_key
         keys.append(Fernet(current_key.encode("utf-8")))
         if settings.INTEGRATION_ENCRYPTION_KEY_PREVIOUS:
             keys.append(Fernet(settings.INTEGRATION_ENCRYPTION_KEY_PREVIOUS.encode("utf-8")))
-        return keys
+        return tuple(keys)
 
     @classmethod
     def encrypt_secret(cls, raw_value: Optional[str]) -> Optional[str]:
@@ -120,6 +124,17 @@ class WebhookService:
         if cls._is_private_host(parsed.hostname):
             raise ValueError("Webhook target resolves to a blocked/private network")
 
+    @staticmethod
+    async def _invalidate_planner_schedule() -> None:
+        """Drop the planner's cached next-due time so webhook changes are picked up on its next tick."""
+        try:
+            from main import redis_client
+
+            if redis_client:
+                await redis_client.delete(PLANNER_NEXT_DUE_KEY)
+        except Exception as exc:
+            logger.warning("Failed to invalidate webhook planner schedule: %s", exc)
+
     @classmethod
     async def create_webhook(cls, *, user_id: UUID, data: Any, db: AsyncSession) -> UserWebhook:
         limits = settings.integration_limits
@@ -178,6 +193,7 @@ class WebhookService:
         db.add(webhook)
         await db.commit()
         await db.refresh(webhook)
+        await cls._invalidate_planner_schedule()
         return webhook
 
     @classmethod
@@ -218,6 +234,7 @@ class WebhookService:
 
         await db.commit()
         await db.refresh(webhook)
+        await cls._invalidate_planner_schedule()
         return webhook
 
     @classmethod
@@ -309,7 +326,7 @@ class WebhookService:
         payload: Dict[str, Any],
         secret: Optional[str],
     ) -> Tuple[bool, int, str]:
-        payload_bytes = json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+        payload_bytes = orjson.dumps(payload)
         signature = cls._sign_payload(payload_bytes=payload_bytes, secret=secret)
 
         headers = {"Content-Type": "application/json"}
@@ -406,11 +423,11 @@ class WebhookService:
             article = entry["article"]
             test_items.append(
                 {
-                    "article_id": str(article.article_id),
+                    "article_id": article.article_id_str,
                     "title": article.title,
                     "url": article.url,
                     "source_name": article.source_name,
-                    "published_date": article.published_date.isoformat() if article.published_date else None,
+                    "published_date": article.published_date_iso,
                 }
             )
         return await cls.deliver_webhook(
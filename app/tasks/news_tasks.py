@@ -3,12 +3,18 @@ import logging
 from typing import Optional, List
 import asyncio
 
-from app.celery_config import celery_app
+from app.celery_config import celery_app, run_async
 from app.core.redis_keys import redis_key
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bound on prepared batches waiting for persistence in the fetch pipeline.
+_FETCH_SAVE_QUEUE_SIZE = 4
+_QUEUE_SENTINEL = object()
+# Queries fetched at once; each one already fans out across NewsAPI, GDELT and RSS.
+_FETCH_QUERY_CONCURRENCY = 2
+
 
 @celery_app.task(
     name='app.tasks.news_tasks.fetch_and_save_news',
@@ -24,7 +30,7 @@ def fetch_and_save_news(
     sources: Optional[List[str]] = None,
     limit_per_query: int = 50
 ):
-    return asyncio.run(_async_fetch_and_save_news(queries, sources, limit_per_query))
+    return run_async(_async_fetch_and_save_news(queries, sources, limit_per_query))
 
 
 async def _async_fetch_and_save_news(
@@ -70,21 +76,20 @@ async def _async_fetch_and_save_news(
             # Create aggregator
             aggregator = NewsAggregatorService(
                 redis_client=redis_client,
-                newsapi_key=settings.NEWS_API_KEY,
+                newsapi_key=settings.news_api_key,
                 cache_ttl=settings.NEWS_CACHE_TTL
             )
 
-            # Get database session
-            async with AsyncSessionLocal() as db:
-                total_saved = 0
-                total_duplicates = 0
-                total_errors = 0
-
-                for query in queries:
-                    logger.info(f"Fetching news for query: {query}")
+            # Fetches run concurrently and hand prepared batches to a single
+            # persistence consumer, so DB writes overlap the slowest upstream fetch.
+            batch_queue: asyncio.Queue = asyncio.Queue(maxsize=_FETCH_SAVE_QUEUE_SIZE)
+            fetch_slots = asyncio.Semaphore(_FETCH_QUERY_CONCURRENCY)
 
-                    try:
-                        topic_hint = [query] if query else None
+            async def produce(query: str) -> int:
+                logger.info(f"Fetching news for query: {query}")
+                try:
+                    topic_hint = [query] if query else None
+                    async with fetch_slots:
                         articles = await aggregator.aggregate_news(
                             query=query,
                             sources=sources,
@@ -93,12 +98,31 @@ async def _async_fetch_and_save_news(
                             use_cache=False,
                             topics=topic_hint
                         )
-                        prepared_articles, pipeline_stats = news_ingestion_service.prepare_articles_for_persistence(
-                            articles,
-                            topic_hints=topic_hint
-                        )
+                    prepared_articles, pipeline_stats = news_ingestion_service.prepare_articles_for_persistence(
+                        articles,
+                        topic_hints=topic_hint
+                    )
+                    if prepared_articles:
+                        await batch_queue.put((query, prepared_articles, pipeline_stats))
+                    return 0
+                except Exception as e:
+                    logger.error(f"Error fetching for query '{query}': {e}", exc_info=True)
+                    return 1
 
-                        if prepared_articles:
+            # Get database session
+            async with AsyncSessionLocal() as db:
+                total_saved = 0
+                total_duplicates = 0
+                total_errors = 0
+
+                async def consume() -> None:
+                    nonlocal total_saved, total_duplicates, total_errors
+                    while True:
+                        batch = await batch_queue.get()
+                        if batch is _QUEUE_SENTINEL:
+                            break
+                        query, prepared_articles, pipeline_stats = batch
+                        try:
                             # Save to database
                             stats = await article_persistence_service.save_articles(
                                 articles=prepared_articles,
@@ -117,10 +141,33 @@ async def _async_fetch_and_save_news(
                                 f"Pipeline accepted {pipeline_stats['accepted_count']}/"
                                 f"{pipeline_stats['input_count']}"
                             )
-                    except Exception as e:
-                        logger.error(f"Error fetching for query '{query}': {e}", exc_info=True)
-                        total_errors += 1
-                        continue
+                        except Exception as e:
+                            logger.error(f"Error saving articles for query '{query}': {e}", exc_info=True)
+                            total_errors += 1
+
+                consumer_task = asyncio.create_task(consume())
+                producers_task = asyncio.ensure_future(asyncio.gather(*(produce(query) for query in queries)))
+                try:
+                    await asyncio.wait({producers_task, consumer_task}, return_when=asyncio.FIRST_COMPLETED)
+                    if not producers_task.done():
+                        # consume() only returns on the sentinel, so it died; producers would block on put() forever
+                        producers_task.cancel()
+                        await asyncio.gather(producers_task, return_exceptions=True)
+                        await consumer_task
+                        raise RuntimeError("Article persistence consumer stopped before fetches finished")
+                    fetch_errors = producers_task.result()
+
+                    # The put cannot block forever: the await below surfaces a dead consumer instead
+                    sentinel_put = asyncio.create_task(batch_queue.put(_QUEUE_SENTINEL))
+                    try:
+                        await consumer_task
+                    finally:
+                        sentinel_put.cancel()
+                finally:
+                    # No-ops once finished; stops both sides if this task is cancelled mid-fetch
+                    producers_task.cancel()
+                    consumer_task.cancel()
+                total_errors += sum(fetch_errors)
 
                 # CRITICAL: Invalidate endpoint cache after fetching new articles
                 if total_saved > 0:
@@ -135,12 +182,11 @@ async def _async_fetch_and_save_news(
                     f"Total errors: {total_errors}"
                 )
 
-                # Update last fetch timestamp in Redis
-                await redis_client.set(
-                    redis_key("news", "last_fetch_timestamp"),
-                    datetime.now(timezone.utc).isoformat(),
-                    ex=86400  # Expire after 24 hours
-                )
+                # Update last fetch timestamp and saved count in Redis (expire after 24 hours)
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.set(redis_key("news", "last_fetch_timestamp"), datetime.now(timezone.utc).isoformat(), ex=86400)
+                    pipe.set(redis_key("news", "last_success_count"), total_saved, ex=86400)
+                    await pipe.execute()
 
                 return {
                     'status': 'success',
@@ -168,7 +214,7 @@ async def _async_fetch_and_save_news(
     retry_jitter=True
 )
 def fetch_rss_feeds(self, feed_urls: Optional[List[str]] = None):
-    return asyncio.run(_async_fetch_rss_feeds(feed_urls))
+    return run_async(_async_fetch_rss_feeds(feed_urls))
 
 
 async def _async_fetch_rss_feeds(feed_urls: Optional[List[str]] = None):
@@ -206,7 +252,7 @@ async def _async_fetch_rss_feeds(feed_urls: Optional[List[str]] = None):
             # Create aggregator
             aggregator = NewsAggregatorService(
                 redis_client=redis_client,
-                newsapi_key=settings.NEWS_API_KEY,
+                newsapi_key=settings.news_api_key,
                 cache_ttl=settings.NEWS_CACHE_TTL
             )
 
@@ -278,7 +324,7 @@ async def _async_fetch_rss_feeds(feed_urls: Optional[List[str]] = None):
     retry_kwargs={'max_retries': 2, 'countdown': 600}
 )
 def cleanup_old_articles(self, days_old: int = 90):
-    return asyncio.run(_async_cleanup_old_articles(days_old))
+    return run_async(_async_cleanup_old_articles(days_old))
 
 
 async def _async_cleanup_old_articles(days_old: int = 90):
@@ -327,7 +373,7 @@ def fetch_news_manual(
     sources: Optional[List[str]] = None,
     limit: int = 50
 ):
-    return asyncio.run(_async_fetch_news_manual(query, sources, limit))
+    return run_async(_async_fetch_news_manual(query, sources, limit))
 
 
 async def _async_fetch_news_manual(
@@ -365,7 +411,7 @@ async def _async_fetch_news_manual(
             # Create aggregator
             aggregator = NewsAggregatorService(
                 redis_client=redis_client,
-                newsapi_key=settings.NEWS_API_KEY,
+                newsapi_key=settings.news_api_key,
                 cache_ttl=settings.NEWS_CACHE_TTL
             )
 
@@ -429,7 +475,7 @@ async def _async_fetch_news_manual(
 )
 def record_celery_runtime_heartbeat(self):
     worker_name = getattr(self.request, "hostname", "unknown-worker")
-    return asyncio.run(_async_record_celery_runtime_heartbeat(worker_name))
+    return run_async(_async_record_celery_runtime_heartbeat(worker_name))
 
 
 async def _async_record_celery_runtime_heartbeat(worker_name: str):
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+import itertools
+import os
 import secrets
-from typing import Dict, Optional, Tuple
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 import redis.asyncio as aioredis
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import selectinload
 import logging
 
-from app.celery_config import celery_app
+from app.celery_config import celery_app, register_worker_loop_cleanup, run_async
 from app.core.redis_keys import redis_key
-from app.models.article import Article
-from app.models.integration import WebhookDeliveryItem, WebhookDeliveryJob, UserWebhook
+from app.models.integration import UserWebhook, WebhookDeliveryItem, WebhookDeliveryJob
 from app.services.api_key_service import api_key_service
-from app.services.delivery_planner_service import delivery_planner_service
+from app.services.delivery_planner_service import PLANNER_NEXT_DUE_KEY, delivery_planner_service
 from app.services.feed_service import feed_service
 from app.services.webhook_service import webhook_service
 from config import settings
@@ -23,40 +28,203 @@ from config import settings
 logger = logging.getLogger(__name__)
 PLANNER_LOCK_KEY = redis_key("integration", "webhook", "planner", "lock")
 PLANNER_LOCK_TTL_SECONDS = 240
+# Pending jobs for the same webhook folded into one outbound request.
+MAX_COALESCED_JOBS = 10
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+# Feed/bundle names change rarely; API-side edits become visible to workers after the TTL.
+SOURCE_CACHE_TTL_SECONDS = 60
+SOURCE_CACHE_MAX_ENTRIES = 1024
+# Upper bound on an idle planner skip, in case a webhook change missed invalidating the schedule.
+PLANNER_IDLE_MAX_SECONDS = 900
+# Pinned maintenance connection is re-validated with SELECT 1 when idle longer than this.
+MAINTENANCE_CONN_HEALTH_CHECK_SECONDS = 60
+DELIVERY_QUEUE_NAME = celery_app.conf.task_routes["app.tasks.webhook_tasks.deliver_webhook_batch"]["queue"]
+
+
+_RELEASE_LOCK_LUA = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) else return 0 end"
+)
 
-
-async def _acquire_planner_lock() -> Tuple[Optional[aioredis.Redis], Optional[str], bool]:
-    try:
-        redis_client = aioredis.from_url(
-            settings.REDIS_URL,
+_REDIS_CLIENTS: Dict[str, aioredis.Redis] = {}
+_REDIS_CLIENTS_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_RELEASE_SCRIPT = None
+# Lock tokens only need to be unique across planner runs; the pid keeps forked workers apart.
+_LOCK_TOKEN_PREFIX = secrets.token_hex(4)
+_LOCK_TOKEN_COUNTER = itertools.count()
+_SOURCE_CACHE: Dict[Tuple, Tuple[float, UUID, str]] = {}
+_MAINTENANCE_CONN: Optional[AsyncConnection] = None
+_MAINTENANCE_CONN_CHECKED_AT = 0.0
+_MAINTENANCE_LOCK: Optional[asyncio.Lock] = None
+_MAINTENANCE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_STALE_CLOSE_TASKS: Set[asyncio.Task] = set()
+
+
+def _close_stale(
+    resource: str,
+    close: Callable[[], Awaitable[object]],
+    owner_loop: Optional[asyncio.AbstractEventLoop],
+) -> None:
+    """Best-effort close of a resource opened on a previous event loop, without blocking the caller."""
+
+    async def _run_close() -> None:
+        try:
+            await close()
+        except Exception as exc:
+            logger.debug("Failed to close stale %s: %s", resource, exc)
+
+    if owner_loop is not None and owner_loop.is_running() and not owner_loop.is_closed():
+        # The owning loop is still alive (another thread): close there, where its transports live.
+        asyncio.run_coroutine_threadsafe(_run_close(), owner_loop)
+        return
+    task = asyncio.get_running_loop().create_task(_run_close())
+    _STALE_CLOSE_TASKS.add(task)
+    task.add_done_callback(_STALE_CLOSE_TASKS.discard)
+
+
+def _get_redis(url: str) -> aioredis.Redis:
+    """Return the worker's shared client for ``url``, rebuilding clients if the event loop changed."""
+    global _REDIS_CLIENTS_LOOP
+    loop = asyncio.get_running_loop()
+    if _REDIS_CLIENTS_LOOP is not loop:
+        # Pooled connections are bound to the loop that opened them; close them rather than leak the pools.
+        for stale_client in _REDIS_CLIENTS.values():
+            _close_stale("Redis client", stale_client.close, _REDIS_CLIENTS_LOOP)
+        _REDIS_CLIENTS.clear()
+        _REDIS_CLIENTS_LOOP = loop
+    client = _REDIS_CLIENTS.get(url)
+    if client is None:
+        client = aioredis.from_url(
+            url,
             encoding="utf-8",
             decode_responses=True,
             max_connections=5,
         )
-        token = secrets.token_hex(16)
+        _REDIS_CLIENTS[url] = client
+    return client
+
+
+def _get_lock_redis() -> aioredis.Redis:
+    return _get_redis(settings.REDIS_URL)
+
+
+async def _close_redis_clients() -> None:
+    global _REDIS_CLIENTS_LOOP
+    clients = list(_REDIS_CLIENTS.values())
+    _REDIS_CLIENTS.clear()
+    _REDIS_CLIENTS_LOOP = None
+    for client in clients:
+        await client.close()
+
+
+register_worker_loop_cleanup(_close_redis_clients)
+
+
+async def _get_maintenance_connection() -> AsyncConnection:
+    global _MAINTENANCE_CONN, _MAINTENANCE_CONN_CHECKED_AT
+    from app.core.database import engine
+
+    conn = _MAINTENANCE_CONN
+    now = time.monotonic()
+    if conn is not None and not conn.closed and not conn.invalidated:
+        if now - _MAINTENANCE_CONN_CHECKED_AT < MAINTENANCE_CONN_HEALTH_CHECK_SECONDS:
+            return conn
+        try:
+            await conn.execute(text("SELECT 1"))
+            await conn.rollback()
+            _MAINTENANCE_CONN_CHECKED_AT = now
+            return conn
+        except Exception as exc:
+            logger.warning("Pinned maintenance connection failed health check, reconnecting: %s", exc)
+            try:
+                await conn.invalidate()
+                await conn.close()
+            except Exception:
+                pass
+
+    _MAINTENANCE_CONN = await engine.connect()
+    _MAINTENANCE_CONN_CHECKED_AT = now
+    return _MAINTENANCE_CONN
+
+
+@asynccontextmanager
+async def _worker_session() -> AsyncIterator[AsyncSession]:
+    """Yield a session on this worker's pinned connection for the periodic integration tasks.
+
+    Periodic ticks skip the pool checkout and pre-ping; the lock keeps overlapping
+    tasks in the same process from sharing the connection at once.
+    """
+    global _MAINTENANCE_CONN, _MAINTENANCE_LOCK, _MAINTENANCE_LOOP
+    from app.core.database import AsyncSessionLocal
+
+    loop = asyncio.get_running_loop()
+    if _MAINTENANCE_LOOP is not loop:
+        # Connections and locks are bound to the loop that created them.
+        if _MAINTENANCE_CONN is not None and not _MAINTENANCE_CONN.closed:
+            _close_stale("maintenance connection", _MAINTENANCE_CONN.close, _MAINTENANCE_LOOP)
+        _MAINTENANCE_CONN = None
+        _MAINTENANCE_LOCK = asyncio.Lock()
+        _MAINTENANCE_LOOP = loop
+
+    async with _MAINTENANCE_LOCK:
+        conn = await _get_maintenance_connection()
+        async with AsyncSessionLocal(bind=conn) as session:
+            try:
+                yield session
+            except BaseException:
+                await session.rollback()
+                raise
+        if conn.in_transaction():
+            await conn.rollback()
+
+
+async def _close_maintenance_connection() -> None:
+    global _MAINTENANCE_CONN, _MAINTENANCE_LOOP
+    conn = _MAINTENANCE_CONN
+    _MAINTENANCE_CONN = None
+    _MAINTENANCE_LOOP = None
+    if conn is not None and not conn.closed:
+        await conn.close()
+
+
+register_worker_loop_cleanup(_close_maintenance_connection)
+
+
+async def _get_delivery_queue_depth() -> Optional[int]:
+    """Return the number of messages waiting on the delivery queue, or None if it cannot be probed."""
+    broker_url = settings.CELERY_BROKER_URL or settings.REDIS_URL
+    if not broker_url.startswith(("redis://", "rediss://")):
+        return None
+    try:
+        return int(await _get_redis(broker_url).llen(DELIVERY_QUEUE_NAME))
+    except Exception as exc:
+        logger.warning("Unable to read delivery queue depth: %s", exc)
+        return None
+
+
+async def _acquire_planner_lock() -> Tuple[Optional[str], bool]:
+    try:
+        redis_client = _get_lock_redis()
+        token = f"{_LOCK_TOKEN_PREFIX}:{os.getpid()}:{next(_LOCK_TOKEN_COUNTER)}"
         acquired = await redis_client.set(PLANNER_LOCK_KEY, token, ex=PLANNER_LOCK_TTL_SECONDS, nx=True)
         if acquired:
-            return redis_client, token, True
-        await redis_client.close()
-        return None, None, False
+            return token, True
+        return None, False
     except Exception as exc:
         logger.warning("Planner lock unavailable, skipping planner run: %s", exc)
-        return None, None, False
+        return None, False
 
 
-async def _release_planner_lock(redis_client: aioredis.Redis, token: str) -> None:
+async def _release_planner_lock(token: str) -> None:
+    global _RELEASE_SCRIPT
     try:
-        await redis_client.eval(
-            "if redis.call('get', KEYS[1]) == ARGV[1] then "
-            "return redis.call('del', KEYS[1]) else return 0 end",
-            1,
-            PLANNER_LOCK_KEY,
-            token,
-        )
+        redis_client = _get_lock_redis()
+        if _RELEASE_SCRIPT is None:
+            # Script objects run via EVALSHA and only resend the source on NOSCRIPT.
+            _RELEASE_SCRIPT = redis_client.register_script(_RELEASE_LOCK_LUA)
+        await _RELEASE_SCRIPT(keys=[PLANNER_LOCK_KEY], args=[token], client=redis_client)
     except Exception as exc:
         logger.warning("Failed to release planner lock: %s", exc)
-    finally:
-        await redis_client.close()
 
 
 @celery_app.task(
@@ -66,33 +234,94 @@ async def _release_planner_lock(redis_client: aioredis.Redis, token: str) -> Non
     retry_kwargs={"max_retries": 3, "countdown": 60},
 )
 def plan_webhook_batches(self):
-    return asyncio.run(_async_plan_webhook_batches())
+    return run_async(_async_plan_webhook_batches())
+
+
+def _enqueue_delivery(job_id: str) -> float:
+    started = time.perf_counter()
+    deliver_webhook_batch.delay(job_id)
+    return time.perf_counter() - started
+
+
+async def _planner_idle_until() -> Optional[datetime]:
+    """Return the published next-due time if it is still in the future."""
+    try:
+        raw = await _get_lock_redis().get(PLANNER_NEXT_DUE_KEY)
+        if not raw:
+            return None
+        next_due = datetime.fromisoformat(raw)
+    except Exception as exc:
+        logger.debug("Planner next-due probe failed: %s", exc)
+        return None
+    return next_due if next_due > datetime.now(timezone.utc) else None
+
+
+async def _publish_planner_next_due(next_due: Optional[datetime]) -> None:
+    now = datetime.now(timezone.utc)
+    if next_due is None:
+        # No active webhooks: idle until a webhook is created or re-enabled.
+        next_due = now + timedelta(seconds=PLANNER_IDLE_MAX_SECONDS)
+    ttl_seconds = min(int((next_due - now).total_seconds()), PLANNER_IDLE_MAX_SECONDS)
+    try:
+        if ttl_seconds > 0:
+            await _get_lock_redis().set(PLANNER_NEXT_DUE_KEY, next_due.isoformat(), ex=ttl_seconds)
+        else:
+            await _get_lock_redis().delete(PLANNER_NEXT_DUE_KEY)
+    except Exception as exc:
+        logger.debug("Failed to publish planner next-due time: %s", exc)
 
 
 async def _async_plan_webhook_batches() -> Dict[str, int]:
     if not settings.ENABLE_INTEGRATION_API or not settings.ENABLE_INTEGRATION_DELIVERY:
         return {"queued_jobs": 0, "due_webhooks": 0}
 
-    lock_client: Optional[aioredis.Redis] = None
-    lock_token: Optional[str] = None
-    lock_client, lock_token, should_run = await _acquire_planner_lock()
+    idle_until = await _planner_idle_until()
+    if idle_until is not None:
+        logger.debug("Skipping webhook planner run; next webhook is due at %s", idle_until.isoformat())
+        return {"queued_jobs": 0, "due_webhooks": 0}
+
+    lock_token, should_run = await _acquire_planner_lock()
     if not should_run:
         logger.info("Skipping webhook planner run because another planner instance holds the lock")
         return {"queued_jobs": 0, "due_webhooks": 0}
 
-    from app.core.database import AsyncSessionLocal
-
     queued_jobs = 0
     due_count = 0
+    deferred_webhooks = 0
+    enqueue_seconds = 0.0
+    pending_enqueue: Optional[asyncio.Task] = None
+    queue_depth = await _get_delivery_queue_depth()
+    # Remaining room on the delivery queue; webhooks beyond it wait for the next tick.
+    enqueue_budget = (
+        max(0, settings.INTEGRATION_MAX_BROKER_BACKLOG - queue_depth) if queue_depth is not None else None
+    )
     try:
-        async with AsyncSessionLocal() as db:
-            due_webhooks = await delivery_planner_service.get_due_webhooks(db=db)
+        async with _worker_session() as db:
+            active_webhooks = await delivery_planner_service.get_active_webhooks(db=db)
+            due_webhooks = delivery_planner_service.filter_due_webhooks(
+                active_webhooks,
+                now=datetime.now(timezone.utc),
+            )
             due_count = len(due_webhooks)
+            sources = await delivery_planner_service.load_webhook_sources(webhooks=due_webhooks, db=db)
+            entries_cache: Dict = {}
+
+            for index, webhook in enumerate(due_webhooks):
+                if enqueue_budget is not None and queued_jobs >= enqueue_budget:
+                    deferred_webhooks = due_count - index
+                    logger.warning(
+                        "Delivery queue backlog at %s (limit %s); deferring %s webhooks to the next planner run",
+                        queue_depth + queued_jobs,
+                        settings.INTEGRATION_MAX_BROKER_BACKLOG,
+                        deferred_webhooks,
+                    )
+                    break
 
-            for webhook in due_webhooks:
                 items, window_start, window_end = await delivery_planner_service.compute_webhook_batch_items(
                     webhook=webhook,
                     db=db,
+                    sources=sources,
+                    entries_cache=entries_cache,
                 )
                 if not items:
                     webhook.last_attempted_at = datetime.now(timezone.utc)
@@ -110,13 +339,40 @@ async def _async_plan_webhook_batches() -> Dict[str, int]:
                     continue
 
                 queued_jobs += 1
-                deliver_webhook_batch.delay(str(job.job_id))
+                # Publish in a thread so the broker round-trip overlaps the next
+                # webhook's DB work; at most one publish is in flight at a time.
+                if pending_enqueue is not None:
+                    enqueue_seconds += await pending_enqueue
+                pending_enqueue = asyncio.create_task(asyncio.to_thread(_enqueue_delivery, str(job.job_id)))
+
+            if not deferred_webhooks:
+                # Attempted webhooks now carry a fresh last_attempted_at, so this is the next real due time.
+                await _publish_planner_next_due(
+                    delivery_planner_service.next_due_at(active_webhooks, now=datetime.now(timezone.utc))
+                )
     finally:
-        if lock_client and lock_token:
-            await _release_planner_lock(lock_client, lock_token)
-
-    logger.info("Planned %s webhook delivery jobs from %s due webhooks", queued_jobs, due_count)
-    return {"queued_jobs": queued_jobs, "due_webhooks": due_count}
+        try:
+            if pending_enqueue is not None:
+                enqueue_seconds += await pending_enqueue
+        finally:
+            if lock_token:
+                await _release_planner_lock(lock_token)
+
+    logger.info(
+        "Planned %s webhook delivery jobs from %s due webhooks (deferred=%s queue_depth=%s enqueue_ms=%.1f)",
+        queued_jobs,
+        due_count,
+        deferred_webhooks,
+        queue_depth,
+        enqueue_seconds * 1000,
+    )
+    return {
+        "queued_jobs": queued_jobs,
+        "due_webhooks": due_count,
+        "deferred_webhooks": deferred_webhooks,
+        "queue_depth": queue_depth if queue_depth is not None else -1,
+        "enqueue_ms": int(enqueue_seconds * 1000),
+    }
 
 
 @celery_app.task(
@@ -126,7 +382,7 @@ async def _async_plan_webhook_batches() -> Dict[str, int]:
     retry_kwargs={"max_retries": 3, "countdown": 60},
 )
 def deliver_webhook_batch(self, job_id: str):
-    return asyncio.run(_async_deliver_webhook_batch(job_id))
+    return run_async(_async_deliver_webhook_batch(job_id))
 
 
 async def _async_deliver_webhook_batch(job_id: str) -> Dict[str, str]:
@@ -141,83 +397,157 @@ async def _async_deliver_webhook_batch(job_id: str) -> Dict[str, str]:
         except ValueError:
             return {"status": "invalid_job_id"}
 
-        job_result = await db.execute(
-            select(WebhookDeliveryJob).where(WebhookDeliveryJob.job_id == job_uuid)
+        claimed = await delivery_planner_service.claim_job(
+            job_id=job_uuid,
+            db=db,
+            lease=_processing_lease(),
         )
-        job = job_result.scalar_one_or_none()
-        if not job:
-            return {"status": "job_not_found"}
-
-        if job.status in {"delivered", "cancelled", "dead_letter"}:
+        if not claimed:
+            status_result = await db.execute(
+                select(WebhookDeliveryJob.status).where(WebhookDeliveryJob.job_id == job_uuid)
+            )
+            current_status = status_result.scalar_one_or_none()
+            if current_status is None:
+                return {"status": "job_not_found"}
+            if current_status == "processing":
+                # Claimed by a concurrent delivery that coalesced it into its own request.
+                return {"status": "in_progress"}
+            if current_status == "retry_pending":
+                # Failed as part of a coalesced delivery; still inside its retry backoff.
+                return {"status": "retry_scheduled"}
             return {"status": "already_terminal"}
 
-        webhook_result = await db.execute(
-            select(UserWebhook).where(UserWebhook.webhook_id == job.webhook_id)
+        job_result = await db.execute(
+            select(WebhookDeliveryJob)
+            .options(
+                selectinload(WebhookDeliveryJob.webhook),
+                selectinload(WebhookDeliveryJob.items).selectinload(WebhookDeliveryItem.article),
+            )
+            .where(WebhookDeliveryJob.job_id == job_uuid)
         )
-        webhook = webhook_result.scalar_one_or_none()
+        job = job_result.scalar_one()
+
+        webhook = job.webhook
         if not webhook or not webhook.is_active:
             job.status = "cancelled"
             job.updated_at = datetime.now(timezone.utc)
             await db.commit()
             return {"status": "webhook_inactive"}
 
-        job.status = "processing"
-        job.updated_at = datetime.now(timezone.utc)
-        await db.commit()
-
-        item_result = await db.execute(
-            select(WebhookDeliveryItem, Article)
-            .join(Article, Article.article_id == WebhookDeliveryItem.article_id)
-            .where(WebhookDeliveryItem.job_id == job.job_id)
-            .order_by(WebhookDeliveryItem.position.asc())
-        )
-        rows = item_result.all()
-        items = []
-        for row_item, article in rows:
-            items.append(
-                {
-                    "article_id": str(article.article_id),
-                    "title": article.title,
-                    "url": article.url,
-                    "source_name": article.source_name,
-                    "published_date": article.published_date.isoformat() if article.published_date else None,
-                    "topics": article.topics or [],
-                }
-            )
-
-        if webhook.feed_id:
-            source = await feed_service.get_feed(feed_id=webhook.feed_id, user_id=webhook.user_id, db=db)
-            source_id = source.feed_id if source else webhook.feed_id
-            source_name = source.name if source else "Feed"
-        else:
-            source = await feed_service.get_bundle(bundle_id=webhook.bundle_id, user_id=webhook.user_id, db=db)
-            source_id = source.bundle_id if source else webhook.bundle_id
-            source_name = source.name if source else "Bundle"
-
-        success, status_code, message = await webhook_service.deliver_webhook(
-            webhook=webhook,
-            source_id=source_id,
-            source_name=source_name,
-            items=items,
+        # The sibling claim commits, which also publishes this job's claim.
+        coalesced_jobs = await delivery_planner_service.claim_pending_sibling_jobs(
+            job=job,
+            db=db,
+            limit=MAX_COALESCED_JOBS - 1,
+            # Keep the merged payload within the published per-batch item limit
+            item_budget=settings.integration_limits["max_items_per_batch"] - int(job.article_count or 0),
         )
-
-        if success:
-            latest_item = items[0] if items else None
-            await delivery_planner_service.mark_job_success(
-                job=job,
-                webhook=webhook,
-                latest_item=latest_item,
+        coalesced_ids = [claimed.job_id for claimed in coalesced_jobs]
+        try:
+            return await _deliver_claimed_jobs(job=job, coalesced_jobs=coalesced_jobs, db=db)
+        except Exception:
+            await db.rollback()
+            # Release the primary claim too, so the autoretry can re-claim it before the lease expires.
+            await delivery_planner_service.release_claimed_jobs(
+                job_ids=[job_uuid, *coalesced_ids],
                 db=db,
             )
-            return {"status": "delivered", "http_status": str(status_code)}
-
-        await delivery_planner_service.mark_job_failure(
+            raise
+
+
+async def _resolve_webhook_source(*, webhook: UserWebhook, db: AsyncSession) -> Tuple[UUID, str]:
+    """Return ``(source_id, source_name)`` for a webhook, cached per worker for a short TTL."""
+    cache_key = ("feed", webhook.feed_id) if webhook.feed_id else ("bundle", webhook.bundle_id)
+    cache_key += (webhook.user_id,)
+    now = time.monotonic()
+    cached = _SOURCE_CACHE.get(cache_key)
+    if cached and cached[0] > now:
+        return cached[1], cached[2]
+
+    if webhook.feed_id:
+        source = await feed_service.get_feed(feed_id=webhook.feed_id, user_id=webhook.user_id, db=db)
+        source_id = source.feed_id if source else webhook.feed_id
+        source_name = source.name if source else "Feed"
+    else:
+        source = await feed_service.get_bundle(bundle_id=webhook.bundle_id, user_id=webhook.user_id, db=db)
+        source_id = source.bundle_id if source else webhook.bundle_id
+        source_name = source.name if source else "Bundle"
+
+    if source:
+        if len(_SOURCE_CACHE) >= SOURCE_CACHE_MAX_ENTRIES:
+            _SOURCE_CACHE.clear()
+        _SOURCE_CACHE[cache_key] = (now + SOURCE_CACHE_TTL_SECONDS, source_id, source_name)
+    return source_id, source_name
+
+
+def _processing_lease() -> timedelta:
+    return timedelta(seconds=max(30, settings.INTEGRATION_WEBHOOK_TIMEOUT_SECONDS * 6))
+
+
+async def _deliver_claimed_jobs(
+    *,
+    job: WebhookDeliveryJob,
+    coalesced_jobs: List[WebhookDeliveryJob],
+    db: AsyncSession,
+) -> Dict[str, str]:
+    webhook = job.webhook
+    articles = []
+    seen_article_ids = set()
+    for claimed_job in [job, *coalesced_jobs]:
+        for row_item in claimed_job.items:
+            article = row_item.article
+            if article is None or article.article_id in seen_article_ids:
+                continue
+            seen_article_ids.add(article.article_id)
+            articles.append(article)
+    if coalesced_jobs:
+        # Newest first across all merged jobs, matching the per-job ordering.
+        articles.sort(key=lambda article: article.published_date or _EPOCH, reverse=True)
+
+    items = [
+        {
+            "article_id": article.article_id_str,
+            "title": article.title,
+            "url": article.url,
+            "source_name": article.source_name,
+            "published_date": article.published_date_iso,
+            "topics": article.topics or [],
+        }
+        for article in articles
+    ]
+
+    source_id, source_name = await _resolve_webhook_source(webhook=webhook, db=db)
+
+    success, status_code, message = await webhook_service.deliver_webhook(
+        webhook=webhook,
+        source_id=source_id,
+        source_name=source_name,
+        items=items,
+    )
+
+    if success:
+        latest_item = items[0] if items else None
+        await delivery_planner_service.mark_job_success(
             job=job,
             webhook=webhook,
-            error=message,
+            latest_item=latest_item,
             db=db,
+            coalesced_jobs=coalesced_jobs,
         )
-        return {"status": "failed", "http_status": str(status_code), "error": message}
+        return {
+            "status": "delivered",
+            "http_status": str(status_code),
+            "coalesced_jobs": str(len(coalesced_jobs)),
+        }
+
+    await delivery_planner_service.mark_job_failure(
+        job=job,
+        webhook=webhook,
+        error=message,
+        db=db,
+        coalesced_jobs=coalesced_jobs,
+    )
+    return {"status": "failed", "http_status": str(status_code), "error": message}
 
 
 @celery_app.task(
@@ -227,16 +557,14 @@ async def _async_deliver_webhook_batch(job_id: str) -> Dict[str, str]:
     retry_kwargs={"max_retries": 2, "countdown": 300},
 )
 def flush_api_key_usage(self):
-    return asyncio.run(_async_flush_api_key_usage())
+    return run_async(_async_flush_api_key_usage())
 
 
 async def _async_flush_api_key_usage() -> Dict[str, int]:
     if not settings.ENABLE_INTEGRATION_API:
         return {"keys_processed": 0, "total_increment": 0}
 
-    from app.core.database import AsyncSessionLocal
-
-    async with AsyncSessionLocal() as db:
+    async with _worker_session() as db:
         result = await api_key_service.flush_usage_to_db(db=db)
         return result
 
@@ -248,16 +576,14 @@ async def _async_flush_api_key_usage() -> Dict[str, int]:
     retry_kwargs={"max_retries": 2, "countdown": 300},
 )
 def cleanup_integration_delivery_history(self):
-    return asyncio.run(_async_cleanup_integration_delivery_history())
+    return run_async(_async_cleanup_integration_delivery_history())
 
 
 async def _async_cleanup_integration_delivery_history() -> Dict[str, int]:
     if not settings.ENABLE_INTEGRATION_API:
         return {"deleted_jobs": 0, "retention_days": int(settings.INTEGRATION_DELIVERY_RETENTION_DAYS)}
 
-    from app.core.database import AsyncSessionLocal
-
-    async with AsyncSessionLocal() as db:
+    async with _worker_session() as db:
         result = await delivery_planner_service.cleanup_delivery_history(
             db=db,
             retention_days=settings.INTEGRATION_DELIVERY_RETENTION_DAYS,
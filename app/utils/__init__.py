@@ -1,6 +1,7 @@
 from app.utils.celery_helpers import (
     get_celery_status,
     get_celery_runtime_heartbeat,
+    get_scheduler_runtime_snapshot,
     get_last_fetch_time,
     trigger_manual_fetch,
     get_task_status,
@@ -11,6 +12,7 @@ from app.utils.celery_helpers import (
 __all__ = [
     'get_celery_status',
     'get_celery_runtime_heartbeat',
+    'get_scheduler_runtime_snapshot',
     'get_last_fetch_time',
     'trigger_manual_fetch',
     'get_task_status',
@@ -1,62 +1,155 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
 import logging
+import time
 import redis.asyncio as aioredis
+from celery import states
 
-from app.celery_config import celery_app
-from app.core.redis_keys import redis_key
+from app.celery_config import WORKER_STATE_TTL_SECONDS, celery_app
+from app.core.redis_keys import redis_key, redis_pattern
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Worker status is polled by dashboards; share one Redis read per window.
+CELERY_STATUS_CACHE_TTL_SECONDS = 5
 
-async def get_celery_status() -> Dict[str, Any]:
+_status_cache: Dict[str, Any] = {'ts': 0.0, 'data': None}
+_status_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=1)
+def _beat_schedule_view() -> Dict[str, Any]:
+    # The beat schedule is fixed once celery_config is imported, so build the view once.
+    return {
+        task_name: {
+            'task': task_config['task'],
+            'schedule': str(task_config['schedule']),
+            'options': task_config.get('options', {})
+        }
+        for task_name, task_config in celery_app.conf.beat_schedule.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _celery_timezone_name() -> str:
+    return str(celery_app.conf.timezone)
+
+
+@lru_cache(maxsize=1)
+def _broker_redis_client() -> Optional[aioredis.Redis]:
+    """Client for the Celery broker when it is a Redis other than REDIS_URL; None otherwise."""
+    broker_url = settings.CELERY_BROKER_URL or settings.REDIS_URL
+    if broker_url == settings.REDIS_URL or not broker_url.startswith(("redis://", "rediss://")):
+        return None
+    return aioredis.from_url(broker_url, decode_responses=True, max_connections=2)
+
+
+async def _get_queue_lengths(queue_names: List[str]) -> Optional[List[int]]:
+    """LLEN each queue on the broker, or None if the broker cannot be probed."""
+    broker_client = _broker_redis_client()
+    if broker_client is None:
+        return None
     try:
-        # Check if workers are active
-        inspect = celery_app.control.inspect()
+        async with broker_client.pipeline(transaction=False) as pipe:
+            for queue_name in queue_names:
+                pipe.llen(queue_name)
+            return await pipe.execute()
+    except Exception as exc:
+        logger.warning("Unable to read Celery queue depth from broker: %s", exc)
+        return None
+
+
+async def _get_celery_status_from_heartbeats(redis_client: aioredis.Redis) -> Optional[Dict[str, Any]]:
+    """Build worker status from the state hashes workers publish; None when no fresh worker state exists."""
+    worker_prefix = redis_key("celery", "workers") + ":"
+    keys = []
+    async for key in redis_client.scan_iter(match=redis_pattern("celery", "workers", "*"), count=100):
+        keys.append(key.decode("utf-8") if isinstance(key, bytes) else key)
+    if not keys:
+        return None
 
-        active_workers = inspect.active()
-        scheduled_tasks = inspect.scheduled()
-        registered_tasks = inspect.registered()
+    queue_names = [queue.name for queue in celery_app.conf.task_queues or ()]
+    broker_url = settings.CELERY_BROKER_URL or settings.REDIS_URL
+    # Queues live on the broker; they share the pipeline only when the broker is REDIS_URL.
+    queues_on_app_redis = broker_url == settings.REDIS_URL
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.hgetall(key)
+        if queues_on_app_redis:
+            for queue_name in queue_names:
+                pipe.llen(queue_name)
+        results = await pipe.execute()
+    worker_states = results[:len(keys)]
+    queue_lengths = results[len(keys):] if queues_on_app_redis else await _get_queue_lengths(queue_names)
+
+    now = datetime.now(timezone.utc)
+    workers = []
+    active_count = 0
+    scheduled_count = 0
+    for key, state in zip(keys, worker_states):
+        last_seen = _normalize_timestamp(state.get("ts")) if state else None
+        if _heartbeat_entry(last_seen, now, WORKER_STATE_TTL_SECONDS)["status"] != "fresh":
+            continue
+        workers.append(key[len(worker_prefix):])
+        active_count += int(state.get("active") or 0)
+        scheduled_count += int(state.get("scheduled") or 0)
+    if not workers:
+        return None
 
-        # Get active task count
-        active_count = 0
-        if active_workers:
-            for worker, tasks in active_workers.items():
-                active_count += len(tasks)
+    return {
+        'enabled': settings.ENABLE_NEWS_SCHEDULER,
+        'source': 'heartbeat',
+        'workers': {
+            'active': len(workers),
+            'workers': sorted(workers)
+        },
+        'tasks': {
+            'active': active_count,
+            'scheduled': scheduled_count,
+            'queued': int(sum(queue_lengths)) if queue_lengths is not None else None,
+            'registered': sorted(name for name in celery_app.tasks if not name.startswith('celery.'))
+        },
+        'beat_schedule': _beat_schedule_view()
+    }
 
-        # Get scheduled task count
-        scheduled_count = 0
-        if scheduled_tasks:
-            for worker, tasks in scheduled_tasks.items():
-                scheduled_count += len(tasks)
 
-        return {
-            'enabled': settings.ENABLE_NEWS_SCHEDULER,
-            'workers': {
-                'active': len(active_workers) if active_workers else 0,
-                'workers': list(active_workers.keys()) if active_workers else []
-            },
-            'tasks': {
-                'active': active_count,
-                'scheduled': scheduled_count,
-                'registered': list(registered_tasks.values())[0] if registered_tasks else []
-            },
-            'beat_schedule': {
-                task_name: {
-                    'schedule': str(task_config['schedule']),
-                    'task': task_config['task']
-                }
-                for task_name, task_config in celery_app.conf.beat_schedule.items()
-            }
-        }
-    except Exception as e:
-        logger.error(f"Error getting Celery status: {e}")
-        return {
-            'enabled': settings.ENABLE_NEWS_SCHEDULER,
-            'error': str(e),
-            'message': 'Celery worker may not be running'
-        }
+async def get_celery_status(redis_client: Optional[aioredis.Redis] = None) -> Dict[str, Any]:
+    """Return worker/task status, cached briefly and shared by concurrent callers."""
+    if time.monotonic() - _status_cache['ts'] < CELERY_STATUS_CACHE_TTL_SECONDS:
+        return _status_cache['data']
+
+    async with _status_lock:
+        if time.monotonic() - _status_cache['ts'] < CELERY_STATUS_CACHE_TTL_SECONDS:
+            return _status_cache['data']
+
+        status = await _fetch_celery_status(redis_client)
+        _status_cache['data'] = status
+        _status_cache['ts'] = time.monotonic()
+        return status
+
+
+async def _fetch_celery_status(redis_client: Optional[aioredis.Redis]) -> Dict[str, Any]:
+    # Workers publish their own state hashes, so the API path is Redis reads only (no inspect() broadcast).
+    error = 'No recent worker status in Redis'
+    if redis_client is not None:
+        try:
+            status = await _get_celery_status_from_heartbeats(redis_client)
+            if status is not None:
+                return status
+        except Exception as e:
+            logger.error(f"Error getting Celery status: {e}")
+            error = str(e)
+    else:
+        error = 'Redis unavailable'
+
+    return {
+        'enabled': settings.ENABLE_NEWS_SCHEDULER,
+        'error': error,
+        'message': 'Celery worker may not be running'
+    }
 
 
 async def get_last_fetch_time(redis_client: aioredis.Redis) -> Optional[datetime]:
@@ -96,36 +189,84 @@ def _heartbeat_entry(last_seen: Optional[datetime], now: datetime, ttl_seconds:
     return {"status": status, "last_seen": last_seen.isoformat(), "age_seconds": age_seconds}
 
 
+def _runtime_heartbeat_ttl() -> int:
+    return max(settings.CELERY_HEARTBEAT_TTL_SECONDS, settings.CELERY_HEARTBEAT_INTERVAL_SECONDS * 2)
+
+
+def _build_runtime_heartbeat(beat_raw: Any, worker_raw: Any) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    ttl_seconds = _runtime_heartbeat_ttl()
+    beat_entry = _heartbeat_entry(_normalize_timestamp(beat_raw), now, ttl_seconds)
+    worker_entry = _heartbeat_entry(_normalize_timestamp(worker_raw), now, ttl_seconds)
+
+    healthy = beat_entry["status"] == "fresh" and worker_entry["status"] == "fresh"
+    return {
+        "healthy": healthy,
+        "interval_seconds": settings.CELERY_HEARTBEAT_INTERVAL_SECONDS,
+        "ttl_seconds": ttl_seconds,
+        "beat": beat_entry,
+        "worker": worker_entry,
+    }
+
+
+def _runtime_heartbeat_error(error: Exception) -> Dict[str, Any]:
+    return {
+        "healthy": False,
+        "error": str(error),
+        "interval_seconds": settings.CELERY_HEARTBEAT_INTERVAL_SECONDS,
+        "ttl_seconds": _runtime_heartbeat_ttl(),
+        "beat": {"status": "unknown", "last_seen": None, "age_seconds": None},
+        "worker": {"status": "unknown", "last_seen": None, "age_seconds": None},
+    }
+
+
 async def get_celery_runtime_heartbeat(redis_client: aioredis.Redis) -> Dict[str, Any]:
     try:
         beat_key = redis_key("celery", "heartbeat", "beat")
         worker_key = redis_key("celery", "heartbeat", "worker", "latest")
         beat_raw, worker_raw = await redis_client.mget(beat_key, worker_key)
+        return _build_runtime_heartbeat(beat_raw, worker_raw)
+    except Exception as e:
+        logger.error(f"Error getting Celery runtime heartbeat: {e}")
+        return _runtime_heartbeat_error(e)
 
-        now = datetime.now(timezone.utc)
-        ttl_seconds = max(settings.CELERY_HEARTBEAT_TTL_SECONDS, settings.CELERY_HEARTBEAT_INTERVAL_SECONDS * 2)
-        beat_entry = _heartbeat_entry(_normalize_timestamp(beat_raw), now, ttl_seconds)
-        worker_entry = _heartbeat_entry(_normalize_timestamp(worker_raw), now, ttl_seconds)
 
-        healthy = beat_entry["status"] == "fresh" and worker_entry["status"] == "fresh"
-        return {
-            "healthy": healthy,
-            "interval_seconds": settings.CELERY_HEARTBEAT_INTERVAL_SECONDS,
-            "ttl_seconds": ttl_seconds,
-            "beat": beat_entry,
-            "worker": worker_entry,
-        }
+async def get_scheduler_runtime_snapshot(redis_client: aioredis.Redis) -> Dict[str, Any]:
+    """Read the runtime heartbeat and last fetch details in a single pipelined round-trip."""
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(redis_key("celery", "heartbeat", "beat"))
+            pipe.get(redis_key("celery", "heartbeat", "worker", "latest"))
+            pipe.get(redis_key("news", "last_fetch_timestamp"))
+            pipe.get(redis_key("news", "last_success_count"))
+            beat_raw, worker_raw, last_fetch_raw, last_saved_raw = await pipe.execute()
     except Exception as e:
-        logger.error(f"Error getting Celery runtime heartbeat: {e}")
-        ttl_seconds = max(settings.CELERY_HEARTBEAT_TTL_SECONDS, settings.CELERY_HEARTBEAT_INTERVAL_SECONDS * 2)
-        return {
-            "healthy": False,
-            "error": str(e),
-            "interval_seconds": settings.CELERY_HEARTBEAT_INTERVAL_SECONDS,
-            "ttl_seconds": ttl_seconds,
-            "beat": {"status": "unknown", "last_seen": None, "age_seconds": None},
-            "worker": {"status": "unknown", "last_seen": None, "age_seconds": None},
-        }
+        logger.error(f"Error getting scheduler runtime snapshot: {e}")
+        return {"heartbeat": _runtime_heartbeat_error(e), "last_fetch": None, "last_fetch_saved": None}
+
+    try:
+        last_fetch_saved = int(last_saved_raw) if last_saved_raw is not None else None
+    except (TypeError, ValueError):
+        last_fetch_saved = None
+
+    return {
+        "heartbeat": _build_runtime_heartbeat(beat_raw, worker_raw),
+        "last_fetch": _normalize_timestamp(last_fetch_raw),
+        "last_fetch_saved": last_fetch_saved,
+    }
+
+
+_news_tasks = None
+
+
+def _get_news_tasks():
+    # Deferred to avoid an import cycle through celery_config's task autodiscovery.
+    global _news_tasks
+    if _news_tasks is None:
+        from app.tasks import news_tasks
+
+        _news_tasks = news_tasks
+    return _news_tasks
 
 
 async def trigger_manual_fetch(
@@ -135,17 +276,22 @@ async def trigger_manual_fetch(
     limit: int = 50
 ) -> Dict[str, Any]:
     try:
-        from app.tasks.news_tasks import fetch_news_manual, fetch_and_save_news
-
-        normalized_queries = [q for q in (queries or []) if q]
-        if query and query not in normalized_queries:
+        news_tasks = _get_news_tasks()
+
+        seen_queries = set()
+        normalized_queries = []
+        for q in queries or []:
+            if q and q not in seen_queries:
+                seen_queries.add(q)
+                normalized_queries.append(q)
+        if query and query not in seen_queries:
             normalized_queries.append(query)
 
         if len(normalized_queries) > 1:
-            task = fetch_and_save_news.delay(normalized_queries, sources, limit)
+            task = news_tasks.fetch_and_save_news.delay(normalized_queries, sources, limit)
         else:
             task_query = normalized_queries[0] if normalized_queries else query
-            task = fetch_news_manual.delay(task_query, sources, limit)
+            task = news_tasks.fetch_news_manual.delay(task_query, sources, limit)
 
         return {
             'success': True,
@@ -163,22 +309,25 @@ async def trigger_manual_fetch(
 
 async def get_task_status(task_id: str) -> Dict[str, Any]:
     try:
-        from celery.result import AsyncResult
-
-        result = AsyncResult(task_id, app=celery_app)
+        # One backend read; status/ready/successful are derived locally instead of
+        # re-querying the backend through AsyncResult properties.
+        meta = await asyncio.to_thread(celery_app.backend.get_task_meta, task_id)
+        task_state = meta.get('status', states.PENDING)
+        ready = task_state in states.READY_STATES
+        successful = task_state == states.SUCCESS
 
         response = {
             'task_id': task_id,
-            'status': result.status,
-            'ready': result.ready(),
-            'successful': result.successful() if result.ready() else None
+            'status': task_state,
+            'ready': ready,
+            'successful': successful if ready else None
         }
 
-        if result.ready():
-            if result.successful():
-                response['result'] = result.result
+        if ready:
+            if successful:
+                response['result'] = meta.get('result')
             else:
-                logger.error(f"Task {task_id} failed: {result.info}")
+                logger.error(f"Task {task_id} failed: {meta.get('result')}")
                 response['error'] = 'Task failed'
 
         return response
@@ -211,15 +360,8 @@ async def revoke_task(task_id: str, terminate: bool = False) -> Dict[str, Any]:
 def get_scheduled_tasks_info() -> Dict[str, Any]:
     """Get information about scheduled periodic tasks"""
     return {
-        'beat_schedule': {
-            task_name: {
-                'task': task_config['task'],
-                'schedule': str(task_config['schedule']),
-                'options': task_config.get('options', {})
-            }
-            for task_name, task_config in celery_app.conf.beat_schedule.items()
-        },
-        'timezone': str(celery_app.conf.timezone),
+        'beat_schedule': _beat_schedule_view(),
+        'timezone': _celery_timezone_name(),
         'enabled': settings.ENABLE_NEWS_SCHEDULER
     }
 
@@ -1,66 +1,148 @@
+from calendar import timegm
 from datetime import datetime, timezone
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Optional, Any, List
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-def parse_iso_date(date_str: Optional[str], fallback_to_now: bool = True) -> Optional[datetime]:
-    if not date_str:
-        return datetime.now(timezone.utc) if fallback_to_now else None
+def _parse_iso_datetime_py(date_str: str) -> datetime:
+    # Fast path for the dominant feed shape 'YYYY-MM-DDTHH:MM:SSZ'
+    if (
+        len(date_str) == 20 and date_str[19] == 'Z' and date_str[10] == 'T'
+        and date_str[4] == '-' and date_str[7] == '-' and date_str[13] == ':' and date_str[16] == ':'
+    ):
+        try:
+            return datetime(
+                int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+                tzinfo=timezone.utc
+            )
+        except ValueError:
+            pass
 
-    try:
-        # Handle both 'Z' suffix and '+00:00' formats
-        normalized = date_str.replace('Z', '+00:00')
-        parsed = datetime.fromisoformat(normalized)
+    # Handle both 'Z' suffix and '+00:00' formats
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
 
-        # Ensure timezone-aware
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
 
-        return parsed
-    except (ValueError, AttributeError) as e:
+try:
+    # C parser: full ISO 8601 grammar, accepts 'Z' natively
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = _parse_iso_datetime_py
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date_cached(date_str: str) -> Optional[datetime]:
+    try:
+        parsed = _parse_iso_datetime(date_str)
+    except (ValueError, AttributeError, TypeError) as e:
         logger.debug(f"Failed to parse ISO date '{date_str}': {e}")
-        return datetime.now(timezone.utc) if fallback_to_now else None
+        return None
 
+    # A trailing 'Z' always yields an aware datetime; otherwise ensure timezone-aware
+    if date_str[-1] != 'Z' and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
-def parse_gdelt_date(date_str: Optional[str], fallback_to_now: bool = True) -> Optional[datetime]:
+
+def parse_iso_date(date_str: Optional[str], fallback_to_now: bool = True) -> Optional[datetime]:
     if not date_str:
         return datetime.now(timezone.utc) if fallback_to_now else None
 
+    # Entries from one fetch often share a timestamp; repeated strings hit the cache.
+    parsed = _parse_iso_date_cached(date_str) if isinstance(date_str, str) else None
+    if parsed is None:
+        return datetime.now(timezone.utc) if fallback_to_now else None
+    return parsed
+
+
+def parse_iso_dates_batch(date_strs: List[Optional[str]], fallback_to_now: bool = True) -> List[Optional[datetime]]:
+    """Parse a column of ISO dates, converting the common 'YYYY-MM-DDTHH:MM:SSZ' shape in one numpy pass."""
+    results: List[Optional[datetime]] = [None] * len(date_strs)
+    utc_indexes = []
+    utc_values = []
+    for index, date_str in enumerate(date_strs):
+        if isinstance(date_str, str) and len(date_str) == 20 and date_str[19] == 'Z' and date_str[10] == 'T':
+            utc_indexes.append(index)
+            utc_values.append(date_str[:19])
+
+    if utc_values:
+        try:
+            parsed_values = np.array(utc_values, dtype='datetime64[s]').astype(object)
+        except ValueError:
+            # One malformed value rejects the whole array; parse those entries individually
+            utc_indexes = []
+        else:
+            for index, value in zip(utc_indexes, parsed_values):
+                results[index] = value.replace(tzinfo=timezone.utc)
+
+    parsed_indexes = set(utc_indexes)
+    for index, date_str in enumerate(date_strs):
+        if index not in parsed_indexes:
+            results[index] = parse_iso_date(date_str, fallback_to_now=fallback_to_now)
+    return results
+
+
+@lru_cache(maxsize=1024)
+def _parse_gdelt_date_cached(date_str: str) -> Optional[datetime]:
     try:
         parsed = datetime.strptime(date_str, '%Y%m%d%H%M%S')
         return parsed.replace(tzinfo=timezone.utc)
     except (ValueError, AttributeError) as e:
         logger.debug(f"Failed to parse GDELT date '{date_str}': {e}")
+        return None
+
+
+def parse_gdelt_date(date_str: Optional[str], fallback_to_now: bool = True) -> Optional[datetime]:
+    if not date_str:
+        return datetime.now(timezone.utc) if fallback_to_now else None
+
+    parsed = _parse_gdelt_date_cached(date_str) if isinstance(date_str, str) else None
+    if parsed is None:
         return datetime.now(timezone.utc) if fallback_to_now else None
+    return parsed
 
 
 def parse_rss_date(entry: Any, fallback_to_now: bool = True) -> Optional[datetime]:
     try:
-        # Try published_parsed first
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            from time import mktime
-            return datetime.fromtimestamp(mktime(entry.published_parsed), tz=timezone.utc)
+        # feedparser normalizes *_parsed to UTC struct_time; timegm converts without local-time lookup
+        published_parsed = getattr(entry, 'published_parsed', None)
+        if published_parsed:
+            return datetime.fromtimestamp(timegm(published_parsed), tz=timezone.utc)
 
         # Fall back to updated_parsed
-        if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            from time import mktime
-            return datetime.fromtimestamp(mktime(entry.updated_parsed), tz=timezone.utc)
+        updated_parsed = getattr(entry, 'updated_parsed', None)
+        if updated_parsed:
+            return datetime.fromtimestamp(timegm(updated_parsed), tz=timezone.utc)
 
         # Try string parsing as last resort
-        if hasattr(entry, 'published') and entry.published:
-            return parse_iso_date(entry.published, fallback_to_now=fallback_to_now)
+        published = getattr(entry, 'published', None)
+        if published:
+            return parse_iso_date(published, fallback_to_now=fallback_to_now)
 
-        if hasattr(entry, 'updated') and entry.updated:
-            return parse_iso_date(entry.updated, fallback_to_now=fallback_to_now)
+        updated = getattr(entry, 'updated', None)
+        if updated:
+            return parse_iso_date(updated, fallback_to_now=fallback_to_now)
 
-    except (ValueError, AttributeError, OverflowError) as e:
+    except (ValueError, AttributeError, OverflowError, TypeError) as e:
         logger.debug(f"Failed to parse RSS date from entry: {e}")
 
     return datetime.now(timezone.utc) if fallback_to_now else None
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(timestamp_float: float) -> Optional[datetime]:
+    try:
+        return datetime.fromtimestamp(timestamp_float, tz=timezone.utc)
+    except (ValueError, OverflowError, OSError) as e:
+        logger.debug(f"Failed to parse timestamp '{timestamp_float}': {e}")
+        return None
+
+
 def parse_timestamp(timestamp: Any, fallback_to_now: bool = True) -> Optional[datetime]:
     if timestamp is None:
         return datetime.now(timezone.utc) if fallback_to_now else None
@@ -68,21 +150,20 @@ def parse_timestamp(timestamp: Any, fallback_to_now: bool = True) -> Optional[da
     try:
         # Handle both int and float timestamps
         timestamp_float = float(timestamp)
-        parsed = datetime.fromtimestamp(timestamp_float, tz=timezone.utc)
-        return parsed
-    except (ValueError, TypeError, OverflowError, OSError) as e:
+    except (ValueError, TypeError, OverflowError) as e:
         logger.debug(f"Failed to parse timestamp '{timestamp}': {e}")
         return datetime.now(timezone.utc) if fallback_to_now else None
 
+    parsed = _parse_timestamp_cached(timestamp_float)
+    if parsed is None:
+        return datetime.now(timezone.utc) if fallback_to_now else None
+    return parsed
 
-def ensure_timezone_aware(dt: Optional[datetime], default_tz=timezone.utc) -> Optional[datetime]:
-    if dt is None:
-        return None
-
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=default_tz)
 
-    return dt
+def ensure_timezone_aware(dt: Optional[datetime], default_tz=timezone.utc) -> Optional[datetime]:
+    if dt is None or dt.tzinfo is not None:
+        return dt
+    return dt.replace(tzinfo=default_tz)
 
 
 def parse_flexible_date(
@@ -90,15 +171,7 @@ def parse_flexible_date(
     formats: Optional[list] = None,
     fallback_to_now: bool = True
 ) -> Optional[datetime]:
-    # Already a datetime
-    if isinstance(date_input, datetime):
-        return ensure_timezone_aware(date_input)
-
-    # Unix timestamp (int or float)
-    if isinstance(date_input, (int, float)):
-        return parse_timestamp(date_input, fallback_to_now)
-
-    # String parsing
+    # String parsing first: ISO strings are by far the most common input
     if isinstance(date_input, str):
         # Try ISO format first (most common)
         result = parse_iso_date(date_input, fallback_to_now=False)
@@ -106,20 +179,28 @@ def parse_flexible_date(
             return result
 
         # Try GDELT format
-        if date_input.isdigit() and len(date_input) == 14:
+        if len(date_input) == 14 and date_input.isdigit():
             result = parse_gdelt_date(date_input, fallback_to_now=False)
             if result:
                 return result
 
         # Try custom formats if provided
         if formats:
+            strptime = datetime.strptime
             for fmt in formats:
                 try:
-                    parsed = datetime.strptime(date_input, fmt)
+                    parsed = strptime(date_input, fmt)
                     return ensure_timezone_aware(parsed)
                 except ValueError:
                     continue
 
+    # Unix timestamp (int or float)
+    elif isinstance(date_input, (int, float)):
+        return parse_timestamp(date_input, fallback_to_now)
+
+    # Already a datetime
+    elif isinstance(date_input, datetime):
+        return ensure_timezone_aware(date_input)
+
     # All parsing failed
     return datetime.now(timezone.utc) if fallback_to_now else None
-
@@ -1,34 +1,67 @@
+import asyncio
+from datetime import datetime
 from typing import Generic, TypeVar, List, Optional
-from pydantic import BaseModel
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.sql import Select
 
 T = TypeVar('T')
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
     has_next: bool
     has_prev: bool
-    total_pages: int
+    total_pages: Optional[int] = None
 
-    class Config:
-        arbitrary_types_allowed = True
+    @classmethod
+    def from_page(cls, page: dict) -> "PaginatedResponse[T]":
+        """Build from a ``paginate_offset`` result without re-validating trusted data."""
+        return cls.model_construct(items=page['items'], **page['meta'])
 
 
 class CursorPaginatedResponse(BaseModel, Generic[T]):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     items: List[T]
     next_cursor: Optional[str] = None
     prev_cursor: Optional[str] = None
-    has_next: bool
+    has_next: Optional[bool] = None
     has_prev: bool
 
-    class Config:
-        arbitrary_types_allowed = True
+    @classmethod
+    def from_page(cls, page: dict) -> "CursorPaginatedResponse[T]":
+        """Build from a ``paginate_cursor`` result without re-validating trusted data."""
+        return cls.model_construct(items=page['items'], **page['meta'])
+
+
+async def _estimate_table_rows(db: AsyncSession, query: Select) -> Optional[int]:
+    """Row estimate from pg_class.reltuples for the query's primary entity, or None if unavailable.
+
+    Runs on its own pooled connection when the session is bound to an engine, so it
+    can overlap the page query issued on the session.
+    """
+    if db.get_bind().dialect.name != 'postgresql':
+        return None
+    table_name = getattr(query.column_descriptions[0].get('entity'), '__tablename__', None)
+    if not table_name:
+        return None
+    estimate_query = text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name")
+    params = {'table_name': table_name}
+    if isinstance(db.bind, AsyncEngine):
+        async with db.bind.connect() as conn:
+            estimate = await conn.scalar(estimate_query, params)
+    else:
+        estimate = await db.scalar(estimate_query, params)
+    # reltuples is -1 until the table has been analyzed
+    return int(estimate) if estimate is not None and estimate >= 0 else None
 
 
 async def paginate_offset(
@@ -36,24 +69,74 @@ async def paginate_offset(
     query: Select,
     page: int = 1,
     page_size: int = 20,
-    max_page_size: int = 100
+    max_page_size: int = 100,
+    include_total: bool = True,
+    approximate_total: bool = False
 ) -> dict:
     # Validate and constrain page_size
     page_size = min(page_size, max_page_size)
     page = max(1, page)  # Ensure page is at least 1
+    offset = (page - 1) * page_size
+
+    if include_total and approximate_total:
+        # Planner statistics instead of a scan; only meaningful for (near-)unfiltered listings
+        page_query = query.offset(offset).limit(page_size)
+        if isinstance(db.bind, AsyncEngine):
+            # Estimate and page on separate connections: one wall-clock round trip
+            total, result = await asyncio.gather(_estimate_table_rows(db, query), db.execute(page_query))
+        else:
+            total = await _estimate_table_rows(db, query)
+            result = await db.execute(page_query)
+        items = result.scalars().all()
+
+        if total is None:
+            total = await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+        else:
+            total = max(total, offset + len(items))
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+        return {
+            'items': items,
+            'meta': {
+                'total': total,
+                'page': page,
+                'page_size': page_size,
+                'has_next': page < total_pages,
+                'has_prev': page > 1,
+                'total_pages': total_pages
+            }
+        }
+
+    if not include_total:
+        # Fetch one extra row to detect a next page without counting
+        result = await db.execute(query.offset(offset).limit(page_size + 1))
+        items = result.scalars().all()
+        has_next = len(items) > page_size
+        return {
+            'items': items[:page_size] if has_next else items,
+            'meta': {
+                'total': None,
+                'page': page,
+                'page_size': page_size,
+                'has_next': has_next,
+                'has_prev': page > 1,
+                'total_pages': None
+            }
+        }
+
+    # Fetch the page and the total in one round trip; COUNT(*) OVER () is evaluated before LIMIT/OFFSET
+    paginated_query = query.add_columns(func.count().over().label('__total')).offset(offset).limit(page_size)
+    rows = (await db.execute(paginated_query)).all()
+    items = [row[0] for row in rows]
 
-    # Count total items
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+    if rows:
+        total = rows[0][-1]
+    else:
+        # Past the last page (or empty): the window yields no rows, so count separately
+        count_query = select(func.count()).select_from(query.subquery())
+        total = await db.scalar(count_query) or 0
 
     # Calculate pagination
     total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-    offset = (page - 1) * page_size
-
-    # Get items for current page
-    paginated_query = query.offset(offset).limit(page_size)
-    result = await db.execute(paginated_query)
-    items = result.scalars().all()
 
     return {
         'items': items,
@@ -68,6 +151,30 @@ async def paginate_offset(
     }
 
 
+def _cursor_column(query: Select, cursor_field: str):
+    """Resolve ``cursor_field`` against the query's primary entity, falling back to its selected columns."""
+    entity = query.column_descriptions[0].get('entity')
+    column = getattr(entity, cursor_field, None) if entity is not None else None
+    if column is None:
+        column = query.selected_columns.get(cursor_field)
+    if column is None:
+        raise ValueError(f"Cursor field '{cursor_field}' is not part of the query")
+    return column
+
+
+def _coerce_cursor(column, cursor: str):
+    """Convert the string cursor to the column's Python type so the comparison can use its index."""
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return cursor
+    if python_type is str:
+        return cursor
+    if python_type is datetime:
+        return datetime.fromisoformat(cursor)
+    return python_type(cursor)
+
+
 async def paginate_cursor(
     db: AsyncSession,
     query: Select,
@@ -79,21 +186,37 @@ async def paginate_cursor(
     # Get one extra item to determine if there's a next page
     limit = page_size + 1
 
+    column = _cursor_column(query, cursor_field)
+
     # Apply cursor filter if provided
     if cursor:
+        try:
+            cursor_value = _coerce_cursor(column, cursor)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor")
         if direction == 'next':
-            query = query.where(getattr(query.column_descriptions[0]['entity'], cursor_field) < cursor)
+            query = query.where(column < cursor_value)
         else:
-            query = query.where(getattr(query.column_descriptions[0]['entity'], cursor_field) > cursor)
+            query = query.where(column > cursor_value)
 
-    # Execute query
-    result = await db.execute(query.limit(limit))
-    items = result.scalars().all()
+    # Keyset pagination relies on walking the cursor column's index in order
+    ascending = False
+    if not query._order_by_clauses:
+        ascending = direction != 'next'
+        query = query.order_by(column.asc() if ascending else column.desc())
 
-    # Check if there are more items
-    has_more = len(items) > page_size
-    if has_more:
-        items = items[:page_size]
+    # Execute query; stop at the sentinel row instead of materializing and slicing it
+    result = await db.execute(query.limit(limit))
+    items = []
+    has_more = False
+    for index, item in enumerate(result.scalars()):
+        if index == page_size:
+            has_more = True
+            break
+        items.append(item)
+    if ascending:
+        # Walked oldest-first to reach the rows just above the cursor; pages stay newest-first
+        items.reverse()
 
     # Get cursors
     next_cursor = None
@@ -17,53 +17,71 @@ apply_custom_css()
 # Initialize authentication state
 init_auth_state()
 
-
-def main() -> None:
-    """Landing page"""
-    verify_token = st.query_params.get("verify_token")
-    if isinstance(verify_token, list):
-        verify_token = verify_token[0] if verify_token else ""
-    verify_token = (verify_token or "").strip()
-    if verify_token:
-        st.session_state["email_verification_token"] = verify_token
-        st.session_state["verify_show_token_form"] = True
-        st.session_state["auth_view"] = "Verify Email"
-        st.query_params.clear()
-        switch_page("login")
-
-    reset_token = st.query_params.get("reset_token")
-    if isinstance(reset_token, list):
-        reset_token = reset_token[0] if reset_token else ""
-    reset_token = (reset_token or "").strip()
-    if reset_token:
-        st.session_state["password_reset_token"] = reset_token
-        st.session_state["reset_show_token_form"] = True
-        st.session_state["auth_view"] = "Reset Password"
-        st.query_params.clear()
-        switch_page("login")
-
-    with st.sidebar:
-        render_contact_developer_option()
-
-    auth_notice = st.session_state.pop("auth_notice", None)
-    if auth_notice:
-        st.warning(auth_notice)
-
-    # ?? Hero ??
-    st.markdown(
-        """
-        <div class="hero">
-            <div class="hero-badge"><span class="hero-badge-icon">RSS</span>News Aggregation + Personalization</div>
-            <h1>Signal Over Noise</h1>
-            <p class="hero-subtitle">
-                Multi-source ingestion, curated content, and a feed that learns from what you read.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    # ?? CTAs ??
+# Static page HTML, built once at import instead of on every rerun
+HERO_HTML = """
+<div class="hero">
+    <div class="hero-badge"><span class="hero-badge-icon">RSS</span>News Aggregation + Personalization</div>
+    <h1>Signal Over Noise</h1>
+    <p class="hero-subtitle">
+        Multi-source ingestion, curated content, and a feed that learns from what you read.
+    </p>
+</div>
+"""
+
+FEATURE_CARDS_HTML = """
+<div class="feature-grid">
+    <div class="feature-card">
+        <div class="card-icon">INGEST</div>
+        <h4>Multi-source coverage</h4>
+        <p class="subtle">Aggregate NewsAPI, GDELT, and RSS into one stream. no tab-hopping required.</p>
+    </div>
+    <div class="feature-card">
+        <div class="card-icon">READ</div>
+        <h4>Clean, focused reading</h4>
+        <p class="subtle">Full articles with key topics highlighted and related content at your fingertips.</p>
+    </div>
+    <div class="feature-card">
+        <div class="card-icon">RANK</div>
+        <h4>Personalized ranking</h4>
+        <p class="subtle">Your feedback trains a ranking model so the feed gets smarter every day.</p>
+    </div>
+</div>
+"""
+
+WORKFLOW_HTML = """
+<div class="workflow-step">
+    <div class="step-number">1</div>
+    <div class="step-content">
+        <h4>Connect &amp; aggregate sources</h4>
+        <p>News is fetched automatically from dozens of RSS feeds, NewsAPI, and GDELT.</p>
+    </div>
+</div>
+<div class="workflow-step">
+    <div class="step-number">2</div>
+    <div class="step-content">
+        <h4>Read &amp; discover</h4>
+        <p>Browse the latest articles, search by keyword, and explore related content.</p>
+    </div>
+</div>
+<div class="workflow-step">
+    <div class="step-number">3</div>
+    <div class="step-content">
+        <h4>Give feedback &amp; personalize</h4>
+        <p>A thumbs-up or thumbs-down trains the model ? your feed improves with every interaction.</p>
+    </div>
+</div>
+"""
+
+FOOTER_HTML = """
+<div class="app-footer">
+    <p>Built with FastAPI, PostgreSQL, Redis, and Reinforcement Learning</p>
+</div>
+"""
+
+
+@st.fragment
+def _cta_block() -> None:
+    """Welcome banner and CTA buttons; reruns on its own when a button is clicked"""
     if st.session_state.get("is_authenticated", False):
         st.success(f"Welcome back, **{st.session_state.get('username', 'User')}**!")
         col_a, col_b, col_c = st.columns(3)
@@ -94,86 +112,70 @@ def main() -> None:
                 st.session_state["auth_view"] = "Register"
                 switch_page("login")
 
+
+def _query_param(name: str) -> str:
+    value = st.query_params.get(name)
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    return (value or "").strip()
+
+
+def _handle_auth_tokens() -> bool:
+    """Route email verification / password reset links to the login page; True if redirected"""
+    verify_token = _query_param("verify_token")
+    if verify_token:
+        st.session_state["email_verification_token"] = verify_token
+        st.session_state["verify_show_token_form"] = True
+        st.session_state["auth_view"] = "Verify Email"
+        st.query_params.clear()
+        switch_page("login")
+        return True
+
+    reset_token = _query_param("reset_token")
+    if reset_token:
+        st.session_state["password_reset_token"] = reset_token
+        st.session_state["reset_show_token_form"] = True
+        st.session_state["auth_view"] = "Reset Password"
+        st.query_params.clear()
+        switch_page("login")
+        return True
+
+    return False
+
+
+def main() -> None:
+    """Landing page"""
+    if _handle_auth_tokens():
+        return
+
+    with st.sidebar:
+        render_contact_developer_option()
+
+    auth_notice = st.session_state.pop("auth_notice", None)
+    if auth_notice:
+        st.warning(auth_notice)
+
+    # ?? Hero ??
+    st.markdown(HERO_HTML, unsafe_allow_html=True)
+
+    # ?? CTAs ??
+    _cta_block()
+
     st.divider()
 
     # ?? Feature cards ??
     st.markdown("### What you get")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(
-            """
-            <div class="feature-card">
-                <div class="card-icon">INGEST</div>
-                <h4>Multi-source coverage</h4>
-                <p class="subtle">Aggregate NewsAPI, GDELT, and RSS into one stream. no tab-hopping required.</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            """
-            <div class="feature-card">
-                <div class="card-icon">READ</div>
-                <h4>Clean, focused reading</h4>
-                <p class="subtle">Full articles with key topics highlighted and related content at your fingertips.</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-    with col3:
-        st.markdown(
-            """
-            <div class="feature-card">
-                <div class="card-icon">RANK</div>
-                <h4>Personalized ranking</h4>
-                <p class="subtle">Your feedback trains a ranking model so the feed gets smarter every day.</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    st.markdown(FEATURE_CARDS_HTML, unsafe_allow_html=True)
 
     st.divider()
 
     # ?? Workflow ? numbered steps ??
     st.markdown("### How it works")
-    st.markdown(
-        """
-        <div class="workflow-step">
-            <div class="step-number">1</div>
-            <div class="step-content">
-                <h4>Connect &amp; aggregate sources</h4>
-                <p>News is fetched automatically from dozens of RSS feeds, NewsAPI, and GDELT.</p>
-            </div>
-        </div>
-        <div class="workflow-step">
-            <div class="step-number">2</div>
-            <div class="step-content">
-                <h4>Read &amp; discover</h4>
-                <p>Browse the latest articles, search by keyword, and explore related content.</p>
-            </div>
-        </div>
-        <div class="workflow-step">
-            <div class="step-number">3</div>
-            <div class="step-content">
-                <h4>Give feedback &amp; personalize</h4>
-                <p>A thumbs-up or thumbs-down trains the model ? your feed improves with every interaction.</p>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(WORKFLOW_HTML, unsafe_allow_html=True)
 
     st.divider()
 
-    st.markdown(
-        """
-        <div class="app-footer">
-            <p>Built with FastAPI, PostgreSQL, Redis, and Reinforcement Learning</p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import os
 import secrets
 import warnings
+from dataclasses import dataclass
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -9,56 +10,42 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration"""
+    """Application configuration (read from the environment once by ``_load``)"""
 
     # API Configuration
-    API_BASE_URL: str = os.getenv("API_BASE_URL", "http://localhost:8000")
-    API_VERSION: str = os.getenv("API_VERSION", "v1")
-    API_ENDPOINT: str = f"{API_BASE_URL}/api/{API_VERSION}"
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development").strip().lower()
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    API_BASE_URL: str
+    API_VERSION: str
+    API_ENDPOINT: str
+    ENVIRONMENT: str
+    DEBUG: bool
 
     # Security
-    _provided_secret: str = os.getenv("SECRET_KEY", "").strip()
-    if _provided_secret:
-        SECRET_KEY: str = _provided_secret
-    elif ENVIRONMENT == "production":
-        raise RuntimeError("SECRET_KEY must be set in production for frontend security")
-    else:
-        SECRET_KEY: str = secrets.token_urlsafe(32)
-        warnings.warn(
-            "Frontend SECRET_KEY is not set; generated ephemeral key for this process. "
-            "Set SECRET_KEY explicitly before production deployment.",
-            UserWarning,
-        )
-
-    SESSION_COOKIE_NAME: str = os.getenv("SESSION_COOKIE_NAME", "news_refresh_token")
-    SESSION_MAX_AGE: int = int(os.getenv("SESSION_MAX_AGE", "86400"))  # 24 hours
+    SECRET_KEY: str
+    SESSION_COOKIE_NAME: str
+    SESSION_MAX_AGE: int
 
     # Features
-    ENABLE_ANALYTICS: bool = os.getenv("ENABLE_ANALYTICS", "true").lower() == "true"
-    ENABLE_INTEGRATIONS: bool = os.getenv(
-        "ENABLE_INTEGRATIONS",
-        os.getenv("ENABLE_INTEGRATION_API", "false"),
-    ).lower() == "true"
-    ARTICLES_PER_PAGE: int = int(os.getenv("ARTICLES_PER_PAGE", "10"))
-    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))
+    ENABLE_ANALYTICS: bool
+    ENABLE_INTEGRATIONS: bool
+    ARTICLES_PER_PAGE: int
+    CACHE_TTL: int
 
     # Sidebar developer contact
-    DEVELOPER_CONTACT_EMAIL: str = os.getenv("DEVELOPER_CONTACT_EMAIL", "").strip()
-    DEVELOPER_CONTACT_URL: str = os.getenv("DEVELOPER_CONTACT_URL", "").strip()
-    DEVELOPER_GITHUB_URL: str = os.getenv("DEVELOPER_GITHUB_URL", "").strip()
-    DEVELOPER_LINKEDIN_URL: str = os.getenv("DEVELOPER_LINKEDIN_URL", "").strip()
-    DEVELOPER_TWITTER_URL: str = os.getenv("DEVELOPER_TWITTER_URL", "").strip()
+    DEVELOPER_CONTACT_EMAIL: str
+    DEVELOPER_CONTACT_URL: str
+    DEVELOPER_GITHUB_URL: str
+    DEVELOPER_LINKEDIN_URL: str
+    DEVELOPER_TWITTER_URL: str
 
     # Page Configuration
     PAGE_TITLE: str = "News Central"
     PAGE_ICON: str = ""
     LAYOUT: str = "wide"
 
-    @classmethod
-    def get_headers(cls, token: Optional[str] = None) -> dict:
+    @staticmethod
+    def get_headers(token: Optional[str] = None) -> dict:
         """Get API request headers"""
         headers = {
             "Content-Type": "application/json",
@@ -69,5 +56,46 @@ class Config:
         return headers
 
 
+def _load() -> Config:
+    """Build the configuration from environment variables"""
+    api_base_url = os.getenv("API_BASE_URL", "http://localhost:8000")
+    api_version = os.getenv("API_VERSION", "v1")
+    environment = os.getenv("ENVIRONMENT", "development").strip().lower()
+
+    secret_key = os.getenv("SECRET_KEY", "").strip()
+    if not secret_key:
+        if environment == "production":
+            raise RuntimeError("SECRET_KEY must be set in production for frontend security")
+        secret_key = secrets.token_urlsafe(32)
+        warnings.warn(
+            "Frontend SECRET_KEY is not set; generated ephemeral key for this process. "
+            "Set SECRET_KEY explicitly before production deployment.",
+            UserWarning,
+        )
+
+    return Config(
+        API_BASE_URL=api_base_url,
+        API_VERSION=api_version,
+        API_ENDPOINT=f"{api_base_url}/api/{api_version}",
+        ENVIRONMENT=environment,
+        DEBUG=os.getenv("DEBUG", "false").lower() == "true",
+        SECRET_KEY=secret_key,
+        SESSION_COOKIE_NAME=os.getenv("SESSION_COOKIE_NAME", "news_refresh_token"),
+        SESSION_MAX_AGE=int(os.getenv("SESSION_MAX_AGE", "86400")),  # 24 hours
+        ENABLE_ANALYTICS=os.getenv("ENABLE_ANALYTICS", "true").lower() == "true",
+        ENABLE_INTEGRATIONS=os.getenv(
+            "ENABLE_INTEGRATIONS",
+            os.getenv("ENABLE_INTEGRATION_API", "false"),
+        ).lower() == "true",
+        ARTICLES_PER_PAGE=int(os.getenv("ARTICLES_PER_PAGE", "10")),
+        CACHE_TTL=int(os.getenv("CACHE_TTL", "300")),
+        DEVELOPER_CONTACT_EMAIL=os.getenv("DEVELOPER_CONTACT_EMAIL", "").strip(),
+        DEVELOPER_CONTACT_URL=os.getenv("DEVELOPER_CONTACT_URL", "").strip(),
+        DEVELOPER_GITHUB_URL=os.getenv("DEVELOPER_GITHUB_URL", "").strip(),
+        DEVELOPER_LINKEDIN_URL=os.getenv("DEVELOPER_LINKEDIN_URL", "").strip(),
+        DEVELOPER_TWITTER_URL=os.getenv("DEVELOPER_TWITTER_URL", "").strip(),
+    )
+
+
 # Export singleton instance
-config = Config()
+config = _load()
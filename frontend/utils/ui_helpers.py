@@ -259,6 +259,18 @@ def apply_custom_css() -> None:
         margin-bottom: 0.3rem;
     }
 
+    .feature-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+    }
+
+    @media (max-width: 640px) {
+        .feature-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+
     .subtle {
         color: var(--md-on-surface-variant);
         font-size: 0.92rem;
@@ -70,6 +70,8 @@ async def lifespan(app: FastAPI):
     global redis_client, celery_monitor_task
 
     # Startup
+    # Process-wide Settings (built once by get_settings); routes may also use Depends(get_settings)
+    app.state.settings = settings
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
 
@@ -132,7 +134,7 @@ async def lifespan(app: FastAPI):
         try:
             from app.utils.celery_helpers import get_celery_status
 
-            celery_status = await asyncio.wait_for(get_celery_status(), timeout=5)
+            celery_status = await asyncio.wait_for(get_celery_status(redis_client), timeout=5)
             active_workers = celery_status.get("workers", {}).get("active", 0)
 
             if active_workers == 0: